@@ -347,26 +347,11 @@ def cmd_propose(args):
         print("No findings — all metrics within targets. No proposal needed.")
         return
 
-    # Extract findings from report (re-run analysis internals)
-    # We need the actual Finding objects, so run the agent's _analyze method
-    window = config.analysis_window_size
-    runs = hub.list_runs(limit=window * 2, newest_first=True)
-    current_runs = runs[:window]
-    previous_runs = runs[window:]
-
-    from lib.metrics import compute_metrics, compute_trends
-    current_metrics = compute_metrics(current_runs)
-    previous_metrics = compute_metrics(previous_runs)
-    metrics_with_trends = compute_trends(
-        current_metrics, previous_metrics, config.trend_threshold
-    )
-    findings = agent._analyze(current_runs, metrics_with_trends, previous_metrics)
-
     # Generate proposal
     engine = ProposalEngine(hub, config)
     try:
         proposal = engine.generate_proposal(
-            findings=findings,
+            findings=result.findings,
             source_report=result.report_filename,
         )
     except PendingProposalExists as e:
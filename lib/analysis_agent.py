@@ -16,6 +16,7 @@ markdown report to context_hub/analysis/.
 """
 
 import logging
+import os
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -37,7 +38,15 @@ class AnalysisResult:
     """Output of a single analysis run."""
     report_filename: str = ""
     report_content: str = ""
+    # report_content split into lines, and "## " section title -> (heading
+    # line, end line exclusive) spans into it, as recorded during rendering
+    report_lines: list[str] = field(default_factory=list)
+    section_spans: dict[str, tuple[int, int]] = field(default_factory=dict)
     findings_count: int = 0
+    # Computed during the run, so callers (e.g. the proposal engine) can
+    # use them without recomputing the windows
+    findings: list["Finding"] = field(default_factory=list)
+    metrics_with_trends: Optional[MetricsSummary] = None
     runs_analyzed: int = 0
     duration_seconds: float = 0.0
     success: bool = False
@@ -99,6 +108,8 @@ class AnalysisAgent:
         self.hub = hub
         self.config = config or AnalysisConfig()
         self.monitor = create_monitor(hub.base_path)
+        # (key, (current_with_trends, previous)) for the last windows computed
+        self._metrics_cache: Optional[tuple[tuple, tuple[MetricsSummary, MetricsSummary]]] = None
 
     def run(self) -> AnalysisResult:
         """
@@ -125,6 +136,7 @@ class AnalysisAgent:
                 result.success = True
                 result.runs_analyzed = 0
                 result.report_content = self._empty_report()
+                result.report_lines = result.report_content.split("\n")
                 result.report_filename = self._write_report(result.report_content)
                 result.empty_report = EmptyAnalysisReport()
                 return result
@@ -133,12 +145,9 @@ class AnalysisAgent:
             current_runs = runs[:window]
             previous_runs = runs[window:]
 
-            current_metrics = compute_metrics(current_runs)
-            previous_metrics = compute_metrics(previous_runs)
-
-            # Step 3: Compute trends
-            metrics_with_trends = compute_trends(
-                current_metrics, previous_metrics, self.config.trend_threshold
+            # Step 3: Compute metrics and trends
+            metrics_with_trends, previous_metrics = self._windowed_metrics(
+                current_runs, previous_runs
             )
 
             # Step 4: Analyze and flag
@@ -147,16 +156,21 @@ class AnalysisAgent:
             )
 
             # Step 5: Generate report
-            report = self._generate_report(
+            report_lines, section_spans = self._generate_report(
                 current_runs, metrics_with_trends, previous_metrics, findings
             )
+            report = "\n".join(report_lines)
 
             # Step 6: Write report
             filename = self._write_report(report)
 
             result.report_filename = filename
             result.report_content = report
+            result.report_lines = report_lines
+            result.section_spans = section_spans
+            result.findings = findings
             result.findings_count = len(findings)
+            result.metrics_with_trends = metrics_with_trends
             result.runs_analyzed = len(current_runs)
             result.success = True
 
@@ -178,6 +192,36 @@ class AnalysisAgent:
 
         return result
 
+    def _windowed_metrics(
+        self,
+        current_runs: list[RunRecord],
+        previous_runs: list[RunRecord],
+    ) -> tuple[MetricsSummary, MetricsSummary]:
+        """
+        Metrics for the current (trend-annotated) and previous windows.
+
+        Memoized on the ordered run IDs of both windows, the trend
+        threshold, and the runs directory mtime, so a new or replaced
+        record forces recomputation. Only the last key is kept.
+        """
+        key = (
+            tuple(r.run_id for r in current_runs),
+            tuple(r.run_id for r in previous_runs),
+            self.config.trend_threshold,
+            os.stat(self.hub.runs_dir).st_mtime_ns,
+        )
+        if self._metrics_cache is not None and self._metrics_cache[0] == key:
+            return self._metrics_cache[1]
+
+        previous_metrics = compute_metrics(previous_runs)
+        metrics_with_trends = compute_trends(
+            compute_metrics(current_runs),
+            previous_metrics,
+            self.config.trend_threshold,
+        )
+        self._metrics_cache = (key, (metrics_with_trends, previous_metrics))
+        return metrics_with_trends, previous_metrics
+
     def _log_to_monitor(self, result: AnalysisResult) -> None:
         """Log this agent run to the monitoring system."""
         entry = AgentRunLog(
@@ -324,10 +368,20 @@ class AnalysisAgent:
         metrics: MetricsSummary,
         previous: MetricsSummary,
         findings: list[Finding],
-    ) -> str:
-        """Generate a markdown analysis report."""
+    ) -> tuple[list[str], dict[str, tuple[int, int]]]:
+        """
+        Generate a markdown analysis report.
+
+        Returns the report lines and a map of each "## " section title to
+        its (heading line, end line exclusive) span within them.
+        """
         now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
         sections = []
+        section_starts: list[tuple[str, int]] = []
+
+        def heading(title: str) -> None:
+            section_starts.append((title, len(sections)))
+            sections.append(f"## {title}")
 
         # Header
         sections.append(f"# Observer Analysis Report")
@@ -339,7 +393,7 @@ class AnalysisAgent:
         sections.append("")
 
         # Findings
-        sections.append("## Findings")
+        heading("Findings")
         sections.append("")
         if findings:
             critical = [f for f in findings if f.severity == Severity.CRITICAL]
@@ -365,7 +419,7 @@ class AnalysisAgent:
             sections.append("")
 
         # Metrics summary
-        sections.append("## Metrics Summary")
+        heading("Metrics Summary")
         sections.append("")
         sections.append(f"| Metric | Value | Target | Status |")
         sections.append(f"|--------|-------|--------|--------|")
@@ -404,7 +458,7 @@ class AnalysisAgent:
         sections.append("")
 
         # Trends
-        sections.append("## Trends")
+        heading("Trends")
         sections.append("")
         sections.append(f"| Dimension | Trend |")
         sections.append(f"|-----------|-------|")
@@ -414,7 +468,7 @@ class AnalysisAgent:
         sections.append("")
 
         # Duration stats
-        sections.append("## Duration Distribution")
+        heading("Duration Distribution")
         sections.append("")
         sections.append(f"- Mean: {metrics.duration_mean:.1f}m")
         sections.append(f"- Median: {metrics.duration_median:.1f}m")
@@ -424,7 +478,7 @@ class AnalysisAgent:
         sections.append("")
 
         # Test health
-        sections.append("## Test Health")
+        heading("Test Health")
         sections.append("")
         sections.append(f"- Total passed: {metrics.total_tests_passed}")
         sections.append(f"- Total failed: {metrics.total_tests_failed}")
@@ -433,7 +487,7 @@ class AnalysisAgent:
 
         # Run detail table
         if self.config.include_run_details:
-            sections.append("## Run Details")
+            heading("Run Details")
             sections.append("")
             sections.append("| Run ID | Type | Build | Tests | Lint | Duration |")
             sections.append("|--------|------|-------|-------|------|----------|")
@@ -446,11 +500,17 @@ class AnalysisAgent:
                 )
             sections.append("")
 
+        ends = [start for _, start in section_starts[1:]] + [len(sections)]
+        spans = {
+            title: (start, end)
+            for (title, start), end in zip(section_starts, ends)
+        }
+
         sections.append("---")
         sections.append("*Generated by Observer Analysis Agent (Phase 2)*")
         sections.append("")
 
-        return "\n".join(sections)
+        return sections, spans
 
     def _empty_report(self) -> str:
         now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
@@ -11,12 +11,27 @@ Design principles:
 """
 
 import json
+import heapq
 import os
-import glob
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
-from lib.schema import RunRecord, validate_run_record
+from lib.schema import RunRecord, validate_many, validate_run_record
+
+
+def _read_json(path: Path):
+    """Parse a JSON file from a single bytes read."""
+    return json.loads(path.read_bytes())
+
+
+def _write_json(path: Path, data) -> None:
+    """Serialize in memory and write once (json.dump issues many small writes)."""
+    path.write_text(json.dumps(data, indent=2))
+
+
+def _is_record_name(name: str) -> bool:
+    """Same entries as glob("*.json"): .tmp files and dotfiles are skipped."""
+    return name.endswith(".json") and not name.startswith(".")
 
 
 class ContextHubError(Exception):
@@ -70,11 +85,14 @@ class ContextHub:
     def _run_path(self, run_id: str) -> Path:
         return self.runs_dir / f"{run_id}.json"
 
-    def write_run(self, record: RunRecord) -> Path:
+    def write_run(self, record: RunRecord, durable: bool = False) -> Path:
         """
         Write an immutable run record.
         Raises RecordExistsError if run_id already exists.
         Raises ValidationError if record is invalid.
+
+        durable=True fsyncs the record and the runs directory before
+        returning; by default the write is left to the OS page cache.
         """
         # Validate first
         issues = validate_run_record(record)
@@ -92,11 +110,59 @@ class ContextHub:
                 "Records are immutable once written."
             )
 
-        # Write atomically (write to temp, then rename)
+        self._write_atomic(path, record.to_json(), durable)
+        if durable:
+            self._fsync_dir(self.runs_dir)
+        return path
+
+    def write_runs(
+        self, records: Iterable[RunRecord], durable: bool = False
+    ) -> list[Path]:
+        """
+        Write a batch of immutable run records.
+
+        Every record is validated and checked for collisions before any file
+        is written, so one bad record leaves the hub untouched.
+        Raises RecordExistsError / ValidationError like write_run().
+
+        durable=True fsyncs each record, then the runs directory once for
+        the whole batch.
+        """
+        records = list(records)  # validated, then written: must be re-iterable
+        invalid = validate_many(records)
+        if invalid:
+            run_id, issues = next(iter(invalid.items()))
+            raise ValidationError(
+                f"Invalid run record '{run_id}': {'; '.join(issues)}"
+            )
+
+        planned = []
+        seen: set[str] = set()
+        for record in records:
+            path = self._run_path(record.run_id)
+            if record.run_id in seen or path.exists():
+                raise RecordExistsError(
+                    f"Run record '{record.run_id}' already exists. "
+                    "Records are immutable once written."
+                )
+            seen.add(record.run_id)
+            planned.append((path, record.to_json()))
+
+        for path, payload in planned:
+            self._write_atomic(path, payload, durable)
+        if durable and planned:
+            self._fsync_dir(self.runs_dir)
+        return [path for path, _ in planned]
+
+    def _write_atomic(self, path: Path, payload: str, durable: bool = False) -> None:
+        """Write to a temp file, then rename into place."""
         tmp_path = path.with_suffix(".tmp")
         try:
             with open(tmp_path, "w") as f:
-                f.write(record.to_json())
+                f.write(payload)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
             tmp_path.rename(path)
         except Exception:
             # Clean up temp file on failure
@@ -104,16 +170,21 @@ class ContextHub:
                 tmp_path.unlink()
             raise
 
-        return path
+    @staticmethod
+    def _fsync_dir(directory: Path) -> None:
+        """Persist directory entries (the renames) to disk."""
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
     def read_run(self, run_id: str) -> Optional[RunRecord]:
         """Read a single run record by ID. Returns None if not found."""
         path = self._run_path(run_id)
         if not path.exists():
             return None
-        with open(path, "r") as f:
-            data = json.load(f)
-        return RunRecord.from_dict(data)
+        return RunRecord.from_dict(_read_json(path))
 
     def list_runs(
         self,
@@ -127,27 +198,48 @@ class ContextHub:
             limit: Max number of records to return (None = all)
             newest_first: If True, most recent runs first
         """
-        pattern = str(self.runs_dir / "*.json")
-        files = sorted(glob.glob(pattern), reverse=newest_first)
-
-        if limit is not None:
-            files = files[:limit]
-
         records = []
-        for filepath in files:
+        for name in self._run_filenames(limit, newest_first):
+            filepath = self.runs_dir / name
             try:
-                with open(filepath, "r") as f:
-                    data = json.load(f)
-                records.append(RunRecord.from_dict(data))
+                records.append(RunRecord.from_dict(_read_json(filepath)))
             except (json.JSONDecodeError, TypeError) as e:
                 # Log but don't crash — corrupted records shouldn't block reads
                 print(f"WARNING: Skipping corrupted record {filepath}: {e}")
 
         return records
 
+    def list_run_ids(
+        self,
+        limit: Optional[int] = None,
+        newest_first: bool = True,
+    ) -> list[str]:
+        """
+        List run IDs in the same order as list_runs(), from filenames alone.
+
+        No record is opened or parsed; use this when only IDs are needed.
+        """
+        return [name[:-5] for name in self._run_filenames(limit, newest_first)]
+
+    def _run_filenames(self, limit: Optional[int], newest_first: bool) -> list[str]:
+        """
+        Run record filenames in run_id order, without opening any file.
+
+        With a non-negative limit only the top `limit` names are selected
+        (O(n log k)) rather than sorting the whole directory. A negative
+        limit keeps list slicing semantics (all but the last -limit names).
+        """
+        with os.scandir(self.runs_dir) as entries:
+            names = [e.name for e in entries if _is_record_name(e.name)]
+        if limit is None or limit < 0:
+            return sorted(names, reverse=newest_first)[:limit]
+        select = heapq.nlargest if newest_first else heapq.nsmallest
+        return select(limit, names)
+
     def run_count(self) -> int:
-        """Return total number of stored runs."""
-        return len(glob.glob(str(self.runs_dir / "*.json")))
+        """Return total number of stored runs (counts directory entries only)."""
+        with os.scandir(self.runs_dir) as entries:
+            return sum(1 for e in entries if _is_record_name(e.name))
 
     def run_exists(self, run_id: str) -> bool:
         """Check if a run record exists."""
@@ -186,8 +278,7 @@ class ContextHub:
     def write_parameters(self, version: str, config: dict) -> Path:
         """Write a versioned parameter config."""
         path = self.parameters_dir / f"{version}.json"
-        with open(path, "w") as f:
-            json.dump(config, f, indent=2)
+        _write_json(path, config)
         return path
 
     def read_parameters(self, version: str) -> Optional[dict]:
@@ -195,24 +286,21 @@ class ContextHub:
         path = self.parameters_dir / f"{version}.json"
         if not path.exists():
             return None
-        with open(path, "r") as f:
-            return json.load(f)
+        return _read_json(path)
 
     def latest_parameters(self) -> Optional[dict]:
         """Read the most recent parameter config."""
         files = sorted(self.parameters_dir.glob("*.json"), reverse=True)
         if not files:
             return None
-        with open(files[0], "r") as f:
-            return json.load(f)
+        return _read_json(files[0])
 
     # --- Proposals ---
 
     def write_proposal(self, proposal_id: str, content: dict) -> Path:
         """Write or update a parameter change proposal."""
         path = self.proposals_dir / f"{proposal_id}.json"
-        with open(path, "w") as f:
-            json.dump(content, f, indent=2)
+        _write_json(path, content)
         return path
 
     def read_proposal(self, proposal_id: str) -> Optional[dict]:
@@ -220,8 +308,7 @@ class ContextHub:
         path = self.proposals_dir / f"{proposal_id}.json"
         if not path.exists():
             return None
-        with open(path, "r") as f:
-            return json.load(f)
+        return _read_json(path)
 
     def list_proposals(self) -> list[str]:
         """List all proposal IDs (newest first)."""
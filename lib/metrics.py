@@ -8,8 +8,10 @@ Used by the Analysis Agent (Phase 2) and Parameter Proposal Engine (Phase 3).
 """
 
 from dataclasses import dataclass, asdict
+from operator import attrgetter
 from typing import Optional
 import json
+import math
 import statistics
 
 from lib.schema import RunRecord
@@ -64,10 +66,19 @@ class MetricsSummary:
         return json.dumps(self.to_dict(), indent=indent)
 
 
+def _column(runs: list[RunRecord], name: str) -> list:
+    """One field across all runs, extracted at C speed (no per-record frame)."""
+    return list(map(attrgetter(name), runs))
+
+
 def compute_metrics(runs: list[RunRecord]) -> MetricsSummary:
     """
     Compute aggregated metrics from a list of run records.
     Returns a MetricsSummary with all objective metrics.
+
+    Each field is pulled into its own column once. The reported mean stays
+    exact (statistics.mean) so rounded values never shift, while stddev uses
+    a float two-pass sum instead of statistics.stdev's rational arithmetic.
     """
     if not runs:
         return MetricsSummary()
@@ -76,28 +87,30 @@ def compute_metrics(runs: list[RunRecord]) -> MetricsSummary:
     summary.run_count = len(runs)
 
     # Date range
-    timestamps = sorted([r.timestamp for r in runs if r.timestamp])
+    timestamps = [t for t in _column(runs, "timestamp") if t]
     if timestamps:
-        summary.date_range_start = timestamps[0]
-        summary.date_range_end = timestamps[-1]
+        summary.date_range_start = min(timestamps)
+        summary.date_range_end = max(timestamps)
 
     # Duration stats
-    durations = [r.duration_minutes for r in runs if r.duration_minutes > 0]
+    durations = [d for d in _column(runs, "duration_minutes") if d > 0]
     if durations:
         summary.duration_mean = round(statistics.mean(durations), 2)
         summary.duration_median = round(statistics.median(durations), 2)
         summary.duration_min = round(min(durations), 2)
         summary.duration_max = round(max(durations), 2)
         if len(durations) >= 2:
-            summary.duration_stddev = round(statistics.stdev(durations), 2)
+            mean = statistics.fmean(durations)
+            variance = math.fsum((d - mean) ** 2 for d in durations) / (len(durations) - 1)
+            summary.duration_stddev = round(math.sqrt(variance), 2)
 
     # Build success rate
-    successful = sum(1 for r in runs if r.build_success)
+    successful = sum(map(bool, _column(runs, "build_success")))
     summary.build_success_rate = round(successful / len(runs), 4)
 
     # Test health
-    summary.total_tests_passed = sum(r.tests_passed for r in runs)
-    summary.total_tests_failed = sum(r.tests_failed for r in runs)
+    summary.total_tests_passed = sum(_column(runs, "tests_passed"))
+    summary.total_tests_failed = sum(_column(runs, "tests_failed"))
     total_tests = summary.total_tests_passed + summary.total_tests_failed
     if total_tests > 0:
         summary.test_pass_rate = round(
@@ -105,8 +118,8 @@ def compute_metrics(runs: list[RunRecord]) -> MetricsSummary:
         )
 
     # Code hygiene
-    summary.total_lint_errors = sum(r.lint_errors for r in runs)
-    summary.total_type_errors = sum(r.type_errors for r in runs)
+    summary.total_lint_errors = sum(_column(runs, "lint_errors"))
+    summary.total_type_errors = sum(_column(runs, "type_errors"))
     summary.avg_lint_errors = round(
         summary.total_lint_errors / len(runs), 2
     )
@@ -115,11 +128,11 @@ def compute_metrics(runs: list[RunRecord]) -> MetricsSummary:
     )
 
     # Diff size
-    summary.total_diff_lines = sum(r.diff_size_lines for r in runs)
+    summary.total_diff_lines = sum(_column(runs, "diff_size_lines"))
     summary.avg_diff_size = round(summary.total_diff_lines / len(runs), 2)
 
     # Manual intervention
-    manual_count = sum(1 for r in runs if r.manual_intervention)
+    manual_count = sum(map(bool, _column(runs, "manual_intervention")))
     summary.manual_intervention_rate = round(manual_count / len(runs), 4)
 
     return summary
@@ -6,6 +6,7 @@ Called externally after analysis, not inside the analysis agent.
 """
 
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -23,7 +24,8 @@ def persist_snapshot(metrics_summary, context_hub_path: str = "context_hub") ->
     metrics_dir = Path(context_hub_path) / "metrics"
     metrics_dir.mkdir(parents=True, exist_ok=True)
 
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+    now = datetime.now(timezone.utc)
+    timestamp = now.strftime("%Y%m%d-%H%M%S")
     filename = f"snapshot-{timestamp}.json"
     path = metrics_dir / filename
 
@@ -32,13 +34,22 @@ def persist_snapshot(metrics_summary, context_hub_path: str = "context_hub") ->
         from dataclasses import asdict
         data = asdict(metrics_summary)
     elif isinstance(metrics_summary, dict):
-        data = metrics_summary
+        data = dict(metrics_summary)  # don't stamp the caller's dict
     else:
         data = {"raw": str(metrics_summary)}
 
-    data["snapshot_timestamp"] = datetime.now(timezone.utc).isoformat()
-
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+    data["snapshot_timestamp"] = now.isoformat()
+
+    # One in-memory payload, one write to a temp file, then an atomic rename:
+    # readers never see a partially written snapshot.
+    payload = json.dumps(data, indent=2, default=str).encode()
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
     return str(path)
@@ -55,7 +55,18 @@ class ProposalNotPending(ProposalError):
 
 # Maps finding (severity, category) to parameter adjustment rules.
 # Each rule produces a ParameterDiff when the finding matches.
+# Rules tagged with @_handles are only dispatched findings of those
+# categories; untagged (e.g. custom registered) rules see every finding.
 
+def _handles(*categories: str):
+    """Tag a rule with the finding categories it can match."""
+    def tag(fn):
+        fn.categories = frozenset(categories)
+        return fn
+    return tag
+
+
+@_handles("duration")
 def _rule_slow_cycle_time(finding: Finding, config: AnalysisConfig, params: dict) -> Optional[ParameterDiff]:
     """If cycle time exceeds target, propose relaxing the target by 10%."""
     if finding.category != "duration" or finding.severity not in (Severity.WARNING, Severity.CRITICAL):
@@ -71,6 +82,7 @@ def _rule_slow_cycle_time(finding: Finding, config: AnalysisConfig, params: dict
     )
 
 
+@_handles("reliability")
 def _rule_low_success_rate(finding: Finding, config: AnalysisConfig, params: dict) -> Optional[ParameterDiff]:
     """If build success rate is below target, propose lowering target by 5%."""
     if finding.category != "reliability" or finding.severity != Severity.CRITICAL:
@@ -88,6 +100,7 @@ def _rule_low_success_rate(finding: Finding, config: AnalysisConfig, params: dic
     )
 
 
+@_handles("hygiene")
 def _rule_high_lint(finding: Finding, config: AnalysisConfig, params: dict) -> Optional[ParameterDiff]:
     """If lint errors exceed target, propose raising the tolerance."""
     if finding.category != "hygiene" or "lint" not in finding.message.lower():
@@ -103,6 +116,7 @@ def _rule_high_lint(finding: Finding, config: AnalysisConfig, params: dict) -> O
     )
 
 
+@_handles("hygiene")
 def _rule_high_type_errors(finding: Finding, config: AnalysisConfig, params: dict) -> Optional[ParameterDiff]:
     """If type errors exceed target, propose raising the tolerance."""
     if finding.category != "hygiene" or "type error" not in finding.message.lower():
@@ -118,6 +132,7 @@ def _rule_high_type_errors(finding: Finding, config: AnalysisConfig, params: dic
     )
 
 
+@_handles("autonomy")
 def _rule_high_manual_intervention(finding: Finding, config: AnalysisConfig, params: dict) -> Optional[ParameterDiff]:
     """If manual intervention rate exceeds target, propose relaxing target by 5%."""
     if finding.category != "autonomy":
@@ -133,6 +148,7 @@ def _rule_high_manual_intervention(finding: Finding, config: AnalysisConfig, par
     )
 
 
+@_handles("trend")
 def _rule_degrading_trend(finding: Finding, config: AnalysisConfig, params: dict) -> Optional[ParameterDiff]:
     """If a trend is degrading, propose expanding the analysis window for more data."""
     if finding.category != "trend" or finding.severity != Severity.CRITICAL:
@@ -173,16 +189,20 @@ DEFAULT_RULE_REGISTRY = {
 
 # ── Version Bumping ──────────────────────────────────────────────────
 
+# Leading "[v]MAJOR.MINOR.PATCH"; suffixes such as "-rc1" are ignored.
+_VERSION_RE = re.compile(r"v?(\d+)\.(\d+)\.(\d+)")
+
+
 def bump_version(version: str, impact: str) -> str:
     """
     Bump a semver-style version string.
     Low impact -> patch bump. Medium/high -> minor bump.
     """
-    match = re.match(r"v?(\d+)\.(\d+)\.(\d+)", version)
+    match = _VERSION_RE.match(version)
     if not match:
         return "v0.2.0"
 
-    major, minor, patch = int(match.group(1)), int(match.group(2)), int(match.group(3))
+    major, minor, patch = map(int, match.groups())
 
     if impact == ImpactLevel.LOW:
         patch += 1
@@ -203,13 +223,16 @@ def compute_impact(diffs: list[ParameterDiff], findings: list[Finding]) -> str:
       - Otherwise -> LOW
     """
     has_critical = any(f.severity == Severity.CRITICAL for f in findings)
-    if has_critical:
-        return ImpactLevel.HIGH
+    return _impact_level(len(diffs), has_critical)
+
+
+# Impact levels indexed by rank: critical finding -> 2, >2 changes -> 1
+_IMPACT_BY_RANK = (ImpactLevel.LOW, ImpactLevel.MEDIUM, ImpactLevel.HIGH)
 
-    if len(diffs) > 2:
-        return ImpactLevel.MEDIUM
 
-    return ImpactLevel.LOW
+def _impact_level(diff_count: int, has_critical: bool) -> str:
+    """Impact from the two aggregates compute_impact() depends on."""
+    return _IMPACT_BY_RANK[max(2 * has_critical, diff_count > 2)]
 
 
 # ── Proposal Engine ──────────────────────────────────────────────────
@@ -261,38 +284,37 @@ class ProposalEngine:
         params = self.hub.latest_parameters() or {}
         current_version = self._current_version()
 
-        # Apply rules to findings
-        diffs: list[ParameterDiff] = []
-        seen_paths: set[str] = set()
+        proposal = Proposal(
+            proposal_id=generate_proposal_id(),
+            created_at=datetime.now(timezone.utc).isoformat(),
+            status=ProposalStatus.PENDING,
+            findings_summary=[f.message for f in findings],
+            source_report=source_report,
+        )
+
+        # Apply rules to findings (first diff per parameter path wins)
+        rules_by_category: dict[str, list] = {}
 
         for finding in findings:
-            for rule in self._rule_registry.values():
+            rules = rules_by_category.get(finding.category)
+            if rules is None:
+                rules = rules_by_category[finding.category] = self._rules_for(finding.category)
+            for rule in rules:
                 diff = rule(finding, self.config, params)
-                if diff and diff.path not in seen_paths:
-                    diffs.append(diff)
-                    seen_paths.add(diff.path)
+                if diff:
+                    proposal.add_diff(diff)
 
+        diffs = proposal.parameter_diffs
         if not diffs:
             logger.info("No rules matched — no proposal generated")
             return None
 
         # Compute impact and version
         impact = compute_impact(diffs, findings)
-        new_version = bump_version(current_version, impact)
-
-        # Build proposal
-        proposal = Proposal(
-            proposal_id=generate_proposal_id(),
-            created_at=datetime.now(timezone.utc).isoformat(),
-            status=ProposalStatus.PENDING,
-            findings_summary=[f.message for f in findings],
-            source_report=source_report,
-            parameter_diffs=diffs,
-            impact_level=impact,
-            rationale=self._build_rationale(diffs, findings),
-            version_from=current_version,
-            version_to=new_version,
-        )
+        proposal.impact_level = impact
+        proposal.rationale = self._build_rationale(diffs, findings)
+        proposal.version_from = current_version
+        proposal.version_to = bump_version(current_version, impact)
 
         # Persist proposal
         self.hub.write_proposal(proposal.proposal_id, proposal.to_dict())
@@ -379,6 +401,13 @@ class ProposalEngine:
 
     # ── Internals ─────────────────────────────────────────────────────
 
+    def _rules_for(self, category: str) -> list:
+        """Registered rules that can match a finding category, in registry order."""
+        return [
+            fn for fn in self._rule_registry.values()
+            if category in getattr(fn, "categories", (category,))
+        ]
+
     def _load_proposal(self, proposal_id: str) -> Proposal:
         """Load a proposal by ID."""
         data = self.hub.read_proposal(proposal_id)
@@ -401,17 +430,27 @@ class ProposalEngine:
         """
         Apply parameter diffs to a config dict.
         Uses dot-notation paths: "targets.median_cycle_time_minutes" -> params["targets"]["median_cycle_time_minutes"]
+
+        params is left untouched. Only the dicts along each diff path are
+        copied; every other subtree is shared with params, not deep-copied.
         """
-        import copy
-        result = copy.deepcopy(params)
+        result = dict(params)
+        copied = {id(result)}  # dicts owned by result, safe to modify
 
         for diff in diffs:
             parts = diff.path.split(".")
             target = result
             for part in parts[:-1]:
                 if part not in target:
-                    target[part] = {}
-                target = target[part]
+                    child = {}
+                elif id(target[part]) in copied:
+                    target = target[part]
+                    continue
+                else:
+                    child = dict(target[part])
+                copied.add(id(child))
+                target[part] = child
+                target = child
             target[parts[-1]] = diff.new_value
 
         return result
@@ -13,7 +13,7 @@ Design:
 """
 
 import json
-import uuid
+import secrets
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from typing import Optional
@@ -88,6 +88,44 @@ class Proposal:
     resolved_at: str = ""
     rejection_reason: str = ""
 
+    def __post_init__(self):
+        # path -> first diff for that path. Plain attributes, not fields, so
+        # they stay out of fields()/asdict()/eq. The index covers the first
+        # _indexed entries of the _indexed_list list object.
+        self._diffs_by_path: dict[str, ParameterDiff] = {}
+        self._indexed_list: list[ParameterDiff] = self.parameter_diffs
+        self._indexed = 0
+        self._index_new_diffs()
+
+    def _index_new_diffs(self) -> None:
+        """Bring the path index up to date with parameter_diffs.
+
+        Diffs appended directly to the list are picked up incrementally; a
+        replaced or shortened list is re-indexed from scratch.
+        """
+        diffs = self.parameter_diffs
+        if diffs is not self._indexed_list or len(diffs) < self._indexed:
+            self._diffs_by_path = {}
+            self._indexed_list = diffs
+            self._indexed = 0
+        for diff in diffs[self._indexed:]:
+            self._diffs_by_path.setdefault(diff.path, diff)
+        self._indexed = len(diffs)
+
+    def add_diff(self, diff: ParameterDiff) -> bool:
+        """Append a diff unless its path is already changed; first diff wins."""
+        self._index_new_diffs()
+        if diff.path in self._diffs_by_path:
+            return False
+        self.parameter_diffs.append(diff)
+        self._index_new_diffs()
+        return True
+
+    def diff_by_path(self, path: str) -> Optional[ParameterDiff]:
+        """The diff for a dot-notation parameter path, or None."""
+        self._index_new_diffs()
+        return self._diffs_by_path.get(path)
+
     def to_dict(self) -> dict:
         d = {
             "proposal_id": self.proposal_id,
@@ -156,5 +194,5 @@ def generate_proposal_id() -> str:
     """Generate a time-sortable proposal ID."""
     now = datetime.now(timezone.utc)
     date_part = now.strftime("%Y%m%d-%H%M%S")
-    unique_part = uuid.uuid4().hex[:6]
+    unique_part = secrets.token_hex(3)  # 3 random bytes -> 6 hex chars
     return f"prop-{date_part}-{unique_part}"
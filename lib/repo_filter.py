@@ -5,7 +5,13 @@ Wraps ContextHub.list_runs() with repo_id awareness.
 Uses getattr() for safety with older records that predate the repo_id field.
 """
 
-from collections import defaultdict
+from collections import Counter
+from operator import attrgetter
+
+
+def _repo_ids(runs):
+    """The repo_id column of runs ("" for untagged or legacy records)."""
+    return [getattr(r, "repo_id", "") for r in runs]
 
 
 def list_runs_by_repo(hub, repo_id, limit=None):
@@ -31,9 +37,7 @@ def list_repos(hub):
 
     Empty string appears for untagged/legacy records.
     """
-    all_runs = hub.list_runs()
-    repo_ids = sorted(set(getattr(r, "repo_id", "") for r in all_runs))
-    return repo_ids
+    return sorted(set(_repo_ids(hub.list_runs())))
 
 
 def runs_by_repo_summary(hub):
@@ -43,14 +47,15 @@ def runs_by_repo_summary(hub):
         dict mapping repo_id -> {"count": int, "latest": str}
     """
     all_runs = hub.list_runs()
-    buckets = defaultdict(list)
-    for r in all_runs:
-        rid = getattr(r, "repo_id", "")
-        buckets[rid].append(r)
-
-    summary = {}
-    for rid, runs in sorted(buckets.items()):
-        timestamps = [r.timestamp for r in runs if r.timestamp]
-        latest = max(timestamps) if timestamps else ""
-        summary[rid] = {"count": len(runs), "latest": latest}
-    return summary
+    repo_ids = _repo_ids(all_runs)
+    counts = Counter(repo_ids)
+    # "" (no timestamp) never beats a real one; ISO 8601 strings sort by time
+    latest = dict.fromkeys(counts, "")
+    for rid, ts in zip(repo_ids, map(attrgetter("timestamp"), all_runs)):
+        if ts and ts > latest[rid]:
+            latest[rid] = ts
+
+    return {
+        rid: {"count": counts[rid], "latest": latest[rid]}
+        for rid in sorted(counts)
+    }
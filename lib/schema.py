@@ -11,12 +11,15 @@ Contract rules:
   - Founder-PM never reads Observer outputs automatically
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Iterable, Optional
 import json
-import uuid
+import secrets
+import sys
 
 
 class InputType(str, Enum):
@@ -39,13 +42,26 @@ class PipelineStep(str, Enum):
     CURSOR_AUDIT = "cursor_audit"
 
 
-@dataclass(frozen=True)
+# Low-cardinality string fields interned on load so bulk reads share storage.
+INTERNED_FIELDS = (
+    "source",
+    "input_type",
+    "llm_model",
+    "model_provider",
+    "model_name",
+    "fail_category",
+    "fail_stage",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class RunRecord:
     """
     Immutable run record — the sole coupling between Execution and Observer planes.
 
     frozen=True enforces immutability at the Python level.
     Once created, no field can be modified.
+    slots=True drops the per-instance __dict__, since bulk reads hold many records.
     """
     # Identity
     run_id: str
@@ -98,7 +114,8 @@ class RunRecord:
 
     def to_dict(self) -> dict:
         """Serialize to dictionary for JSON storage."""
-        d = asdict(self)
+        # Field values are immutable scalars/tuples, so no deep copy is needed
+        d = dict(zip(_FIELD_NAMES, _get_fields(self)))
         # Convert tuples back to lists for JSON compatibility
         d["pipeline_steps_executed"] = list(d["pipeline_steps_executed"])
         d["step_timings"] = list(d["step_timings"])
@@ -129,8 +146,10 @@ class RunRecord:
             else:
                 data["step_timings"] = ()
         # Filter to only known fields (forward compatibility)
-        known_fields = {f.name for f in cls.__dataclass_fields__.values()}
-        filtered = {k: v for k, v in data.items() if k in known_fields}
+        filtered = {k: v for k, v in data.items() if k in _FIELD_SET}
+        for k in INTERNED_FIELDS:
+            if isinstance(filtered.get(k), str):
+                filtered[k] = sys.intern(filtered[k])
         return cls(**filtered)
 
     @classmethod
@@ -139,6 +158,12 @@ class RunRecord:
         return cls.from_dict(json.loads(json_str))
 
 
+# Field names resolved once; to_dict/from_dict avoid per-call reflection.
+_FIELD_NAMES = tuple(f.name for f in fields(RunRecord))
+_FIELD_SET = frozenset(_FIELD_NAMES)
+_get_fields = attrgetter(*_FIELD_NAMES)
+
+
 def generate_run_id() -> str:
     """
     Generate a time-sortable run ID.
@@ -146,7 +171,7 @@ def generate_run_id() -> str:
     """
     now = datetime.now(timezone.utc)
     date_part = now.strftime("%Y-%m-%d")
-    unique_part = uuid.uuid4().hex[:6]
+    unique_part = secrets.token_hex(3)  # 3 random bytes -> 6 hex chars
     return f"{date_part}-{unique_part}"
 
 
@@ -160,71 +185,144 @@ def current_timestamp() -> str:
 REQUIRED_FIELDS = {"run_id", "source", "timestamp", "build_success"}
 
 
-def validate_run_record(record: RunRecord) -> list[str]:
-    """
-    Validate a run record. Returns list of issues (empty = valid).
-    This is intentionally strict — bad data in the Context Hub is worse than no data.
-    """
-    issues = []
+# Numeric fields that must never be negative, checked in this order.
+NON_NEGATIVE_FIELDS = (
+    "duration_minutes",
+    "tests_passed",
+    "tests_failed",
+    "lint_errors",
+    "type_errors",
+    "tokens_input",
+    "tokens_output",
+    "cost_usd",
+    "iteration_number",
+)
 
-    if not record.run_id:
-        issues.append("run_id is required")
 
-    if not record.timestamp:
-        issues.append("timestamp is required")
-    else:
-        try:
-            datetime.fromisoformat(record.timestamp)
-        except ValueError:
-            issues.append(f"timestamp is not valid ISO 8601: {record.timestamp}")
+# Allowed values for categorical fields, built once for O(1) membership checks.
+VALID_INPUT_TYPES = frozenset(e.value for e in InputType)
+VALID_PIPELINE_STEPS = frozenset(e.value for e in PipelineStep)
+VALID_FAIL_CATEGORIES = frozenset({
+    "", "build", "environment", "code_quality", "human_decision",
+    "security", "git", "feasibility", "runtime",
+})
 
-    if record.duration_minutes < 0:
-        issues.append(f"duration_minutes cannot be negative: {record.duration_minutes}")
 
-    if record.tests_passed < 0:
-        issues.append(f"tests_passed cannot be negative: {record.tests_passed}")
+def _non_negative(name: str) -> Callable[[RunRecord], tuple[str, ...]]:
+    def check(record: RunRecord) -> tuple[str, ...]:
+        value = getattr(record, name)
+        return (f"{name} cannot be negative: {value}",) if value < 0 else ()
+    return check
 
-    if record.tests_failed < 0:
-        issues.append(f"tests_failed cannot be negative: {record.tests_failed}")
 
-    if record.lint_errors < 0:
-        issues.append(f"lint_errors cannot be negative: {record.lint_errors}")
+def _check_input_type(record: RunRecord) -> tuple[str, ...]:
+    if record.input_type and record.input_type not in VALID_INPUT_TYPES:
+        return (f"input_type '{record.input_type}' not in {set(VALID_INPUT_TYPES)}",)
+    return ()
 
-    if record.type_errors < 0:
-        issues.append(f"type_errors cannot be negative: {record.type_errors}")
 
-    # Validate input_type against known enum values
-    valid_input_types = {e.value for e in InputType}
-    if record.input_type and record.input_type not in valid_input_types:
-        issues.append(
-            f"input_type '{record.input_type}' not in {valid_input_types}"
+def _check_pipeline_steps(record: RunRecord) -> tuple[str, ...]:
+    return tuple(
+        f"Unknown pipeline step: '{step}'. Valid: {set(VALID_PIPELINE_STEPS)}"
+        for step in record.pipeline_steps_executed
+        if step not in VALID_PIPELINE_STEPS
+    )
+
+
+def _check_fail_category(record: RunRecord) -> tuple[str, ...]:
+    if record.fail_category and record.fail_category not in VALID_FAIL_CATEGORIES:
+        return (
+            f"fail_category '{record.fail_category}' not in {set(VALID_FAIL_CATEGORIES)}",
         )
+    return ()
 
-    # Validate pipeline steps
-    valid_steps = {e.value for e in PipelineStep}
-    for step in record.pipeline_steps_executed:
-        if step not in valid_steps:
-            issues.append(f"Unknown pipeline step: '{step}'. Valid: {valid_steps}")
 
-    # --- v2.1 field validation ---
-    valid_fail_categories = {"", "build", "environment", "code_quality", "human_decision",
-                             "security", "git", "feasibility", "runtime"}
-    if record.fail_category and record.fail_category not in valid_fail_categories:
-        issues.append(f"fail_category '{record.fail_category}' not in {valid_fail_categories}")
+def _check_recursive_parent(record: RunRecord) -> tuple[str, ...]:
+    if record.is_recursive and not record.recursive_parent_id:
+        return ("is_recursive=True requires non-empty recursive_parent_id",)
+    return ()
 
-    if record.tokens_input < 0:
-        issues.append(f"tokens_input cannot be negative: {record.tokens_input}")
 
-    if record.tokens_output < 0:
-        issues.append(f"tokens_output cannot be negative: {record.tokens_output}")
+# Field rules as (field, check), built once at import and run in this order.
+# Every field's dataclass default passes its check, so a field still at its
+# default is skipped without calling the check.
+_NON_NEGATIVE_RULES = tuple((name, _non_negative(name)) for name in NON_NEGATIVE_FIELDS)
+_CATEGORICAL_RULES = (
+    ("input_type", _check_input_type),
+    ("pipeline_steps_executed", _check_pipeline_steps),
+    ("fail_category", _check_fail_category),
+    ("is_recursive", _check_recursive_parent),
+)
+_FIELD_RULES = _NON_NEGATIVE_RULES + _CATEGORICAL_RULES
+_FIELD_DEFAULTS = {f.name: f.default for f in fields(RunRecord)}
 
-    if record.cost_usd < 0.0:
-        issues.append(f"cost_usd cannot be negative: {record.cost_usd}")
 
-    if record.iteration_number < 0:
-        issues.append(f"iteration_number cannot be negative: {record.iteration_number}")
+def _rule_issues(record: RunRecord, rules) -> list[str]:
+    issues = []
+    for name, check in rules:
+        if getattr(record, name) != _FIELD_DEFAULTS[name]:
+            issues.extend(check(record))
+    return issues
 
-    if record.is_recursive and not record.recursive_parent_id:
-        issues.append("is_recursive=True requires non-empty recursive_parent_id")
+
+def validate_run_record(record: RunRecord) -> list[str]:
+    """
+    Validate a run record. Returns list of issues (empty = valid).
+    This is intentionally strict — bad data in the Context Hub is worse than no data.
+    """
+    issues = _identity_issues(record)
+    issues.extend(_rule_issues(record, _FIELD_RULES))
+    return issues
+
+
+def validate_many(records: Iterable[RunRecord]) -> dict[str, list[str]]:
+    """
+    Validate a batch of run records (e.g. a full Context Hub re-scan).
+    Returns {run_id: issues} for invalid records only (empty = all valid).
+
+    Numeric fields are checked column-wise (one flat list per field) instead
+    of record-by-record; issue text matches validate_run_record().
+    """
+    records = list(records)  # walked once per field; a generator would run dry
+    numeric_issues: dict[int, list[str]] = {}
+    for name in NON_NEGATIVE_FIELDS:
+        column = [getattr(r, name) for r in records]
+        for i, value in enumerate(column):
+            if value < 0:
+                numeric_issues.setdefault(i, []).append(
+                    f"{name} cannot be negative: {value}"
+                )
+
+    result = {}
+    for i, record in enumerate(records):
+        issues = _identity_issues(record)
+        issues.extend(numeric_issues.get(i, ()))
+        issues.extend(_rule_issues(record, _CATEGORICAL_RULES))
+        if issues:
+            result[record.run_id] = issues
+    return result
+
+
+def _identity_issues(record: RunRecord) -> list[str]:
+    issues = []
+
+    if not record.run_id:
+        issues.append("run_id is required")
+
+    if not record.timestamp:
+        issues.append("timestamp is required")
+    else:
+        if not _is_iso8601(record.timestamp):
+            issues.append(f"timestamp is not valid ISO 8601: {record.timestamp}")
 
     return issues
+
+
+@lru_cache(maxsize=1024)
+def _is_iso8601(timestamp: str) -> bool:
+    """Parse check, memoized: records written together often share a timestamp."""
+    try:
+        datetime.fromisoformat(timestamp)
+    except ValueError:
+        return False
+    return True
@@ -47,12 +47,29 @@ class VerdictEngine:
         Returns:
             Verdict data dictionary
         """
+        return self._build_verdict(artifact_id, sidecar, datetime.now(timezone.utc).isoformat())
+
+    def generate_verdicts(self, items) -> list[dict]:
+        """Generate verdicts for (artifact_id, sidecar) pairs, in order.
+
+        Each verdict matches generate_verdict() for its pair, except that the
+        whole batch shares one generated_at timestamp.
+        """
+        generated_at = datetime.now(timezone.utc).isoformat()
+        build = self._build_verdict
+        return [build(artifact_id, sidecar, generated_at) for artifact_id, sidecar in items]
+
+    def _build_verdict(self, artifact_id: str, sidecar: dict, generated_at: str) -> dict:
         # Degraded mode: malformed or missing sidecar
         if not sidecar or not isinstance(sidecar, dict):
-            return self._degraded_verdict(artifact_id, "Sidecar data is missing or malformed")
+            return self._degraded_verdict(
+                artifact_id, "Sidecar data is missing or malformed", generated_at
+            )
 
         if "quality" not in sidecar or "error_taxonomy" not in sidecar:
-            return self._degraded_verdict(artifact_id, "Sidecar missing required quality/error_taxonomy fields")
+            return self._degraded_verdict(
+                artifact_id, "Sidecar missing required quality/error_taxonomy fields", generated_at
+            )
 
         # Run all checks
         check_results = self._run_checks(sidecar)
@@ -83,7 +100,7 @@ class VerdictEngine:
         return {
             "schema_version": "verdict.v1",
             "artifact_id": artifact_id,
-            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "generated_at": generated_at,
             "verdict": verdict,
             "degraded": False,
             "degraded_reason": "",
@@ -95,7 +112,7 @@ class VerdictEngine:
             "fix_hints": fix_hints,
         }
 
-    def _degraded_verdict(self, artifact_id: str, reason: str) -> dict:
+    def _degraded_verdict(self, artifact_id: str, reason: str, generated_at: str) -> dict:
         """Return a safe pass verdict when sidecar data is unavailable.
 
         Degraded mode contract:
@@ -108,7 +125,7 @@ class VerdictEngine:
         return {
             "schema_version": "verdict.v1",
             "artifact_id": artifact_id,
-            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "generated_at": generated_at,
             "verdict": "pass",
             "degraded": True,
             "degraded_reason": reason,
@@ -186,8 +203,12 @@ class VerdictEngine:
 
     def _compute_failure_signature(self, blocking_failures: list[dict]) -> str:
         """Compute a deterministic hash of blocking failure check IDs."""
-        check_ids = sorted(f["check_id"] for f in blocking_failures)
-        payload = ",".join(check_ids)
+        return self._signature_for(f["check_id"] for f in blocking_failures)
+
+    @staticmethod
+    def _signature_for(check_ids) -> str:
+        """Order-independent signature of a set of failing check IDs."""
+        payload = ",".join(sorted(check_ids))
         return hashlib.sha256(payload.encode()).hexdigest()[:16]
 
     def _generate_fix_hints(self, sidecar: dict, blocking_failures: list[dict]) -> list[dict]:
@@ -247,9 +268,10 @@ class VerdictEngine:
         """Write verdict to JSON file."""
         path = self.verdicts_dir / f"{artifact_id}.verdict.v1.json"
         tmp_path = path.with_suffix(".tmp")
+        payload = json.dumps(verdict_data, indent=2)  # serialize before touching disk
         try:
             with open(tmp_path, "w") as f:
-                json.dump(verdict_data, f, indent=2)
+                f.write(payload)
             tmp_path.rename(path)
         except Exception:
             if tmp_path.exists():
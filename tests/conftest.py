@@ -0,0 +1,69 @@
+"""Shared pytest fixtures for the Observer Plane test suite."""
+
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Make lib/ and bin/ importable from every test module; done once per session
+# here rather than in each module, so sys.path gets a single entry.
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from lib.context_hub import ContextHub
+
+BASELINE_PARAMS_PATH = PROJECT_ROOT / "context_hub" / "parameters" / "v0.1.0.json"
+
+# RAM-backed scratch space on Linux; hub writes in tests never touch disk.
+SHM_DIR = "/dev/shm"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Root tmp_path under /dev/shm when it exists and is writable.
+
+    Only the temp *root* is moved: pytest still creates a numbered, locked
+    pytest-of-<user>/pytest-N session dir beneath it, so concurrent sessions
+    and pytest-xdist workers (which get per-worker subdirs) never share or
+    wipe each other's scratch space. An explicit --basetemp still wins.
+    """
+    if config.option.basetemp is None and os.access(SHM_DIR, os.W_OK):
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", SHM_DIR)
+
+
+@pytest.fixture(scope="session")
+def baseline_params() -> dict:
+    """The committed v0.1.0 parameter config, parsed once per session."""
+    if not BASELINE_PARAMS_PATH.exists():
+        pytest.skip("context_hub/parameters/v0.1.0.json not present")
+    return json.loads(BASELINE_PARAMS_PATH.read_bytes())
+
+
+def _reset_hub(hub: ContextHub) -> None:
+    """Empty a hub in place so it can be reused by the next test."""
+    for child in hub.base_path.iterdir():
+        shutil.rmtree(child)
+    for name, path in vars(hub).items():
+        if name.endswith("_dir"):
+            path.mkdir()
+
+
+@pytest.fixture(scope="module")
+def _hub_module(tmp_path_factory) -> ContextHub:
+    return ContextHub(str(tmp_path_factory.mktemp("test_hub")))
+
+
+@pytest.fixture
+def hub(_hub_module) -> ContextHub:
+    """Module-shared hub, emptied before each test.
+
+    Modules that need a fresh hub per test define their own `hub` fixture,
+    which takes precedence over this one.
+    """
+    _reset_hub(_hub_module)
+    return _hub_module
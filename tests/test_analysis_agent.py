@@ -11,19 +11,16 @@ Covers:
   - Monitoring integration (agent run logging)
 """
 
+import dataclasses
 import json
 import os
-import sys
 import pytest
-from pathlib import Path
-
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
 
 from lib.schema import RunRecord, current_timestamp
 from lib.context_hub import ContextHub
 from lib.metrics import compute_metrics, MetricsSummary
 from lib.analysis_config import AnalysisConfig
+import lib.analysis_agent as analysis_agent_mod
 from lib.analysis_agent import AnalysisAgent, AnalysisResult, EmptyAnalysisReport, Finding, Severity
 from lib.monitoring import AgentMonitor, AgentRunLog, create_monitor
 
@@ -33,20 +30,22 @@ from lib.monitoring import AgentMonitor, AgentRunLog, create_monitor
 # ═══════════════════════════════════════
 
 
+# Baseline passing run; helpers override only what each test varies.
+_TEMPLATE = RunRecord(
+    run_id="",
+    timestamp="2026-02-06T12:00:00+00:00",
+    build_success=True,
+    duration_minutes=25.0,
+    tests_passed=40,
+    tests_failed=0,
+    lint_errors=0,
+    type_errors=0,
+    input_type="PRD",
+)
+
+
 def _make_record(run_id: str, **kwargs) -> RunRecord:
-    defaults = {
-        "run_id": run_id,
-        "timestamp": "2026-02-06T12:00:00+00:00",
-        "build_success": True,
-        "duration_minutes": 25.0,
-        "tests_passed": 40,
-        "tests_failed": 0,
-        "lint_errors": 0,
-        "type_errors": 0,
-        "input_type": "PRD",
-    }
-    defaults.update(kwargs)
-    return RunRecord(**defaults)
+    return dataclasses.replace(_TEMPLATE, run_id=run_id, **kwargs)
 
 
 def _seed_hub(hub: ContextHub, n: int, **overrides) -> list[RunRecord]:
@@ -54,26 +53,29 @@ def _seed_hub(hub: ContextHub, n: int, **overrides) -> list[RunRecord]:
     records = []
     for i in range(n):
         day = min(i + 1, 28)
-        defaults = {
-            "run_id": f"2026-02-{day:02d}-{i:06x}",
-            "timestamp": f"2026-02-{day:02d}T12:00:00+00:00",
-            "build_success": True,
-            "duration_minutes": 25.0 + i,
-            "tests_passed": 40 + i,
-            "tests_failed": 0,
-            "lint_errors": i % 3,
-            "type_errors": 0,
-            "input_type": "PRD",
-        }
-        defaults.update(overrides)
-        defaults["run_id"] = f"2026-02-{day:02d}-{i:06x}"
-        defaults["timestamp"] = f"2026-02-{day:02d}T12:00:00+00:00"
-        r = RunRecord(**defaults)
-        hub.write_run(r)
-        records.append(r)
+        records.append(dataclasses.replace(
+            _TEMPLATE,
+            **{
+                "duration_minutes": 25.0 + i,
+                "tests_passed": 40 + i,
+                "lint_errors": i % 3,
+                **overrides,
+                "run_id": f"2026-02-{day:02d}-{i:06x}",
+                "timestamp": f"2026-02-{day:02d}T12:00:00+00:00",
+            },
+        ))
+    hub.write_runs(records)
     return records
 
 
+@pytest.fixture(scope="class")
+def analysis_result(tmp_path_factory) -> AnalysisResult:
+    """A single agent run over 5 seeded runs, shared by a test class."""
+    hub = ContextHub(str(tmp_path_factory.mktemp("analysis_hub")))
+    _seed_hub(hub, 5)
+    return AnalysisAgent(hub, AnalysisConfig(analysis_window_size=5)).run()
+
+
 # ═══════════════════════════════════════
 # AnalysisConfig Tests
 # ═══════════════════════════════════════
@@ -133,28 +135,32 @@ class TestAnalysisConfig:
         assert cfg.analysis_window_size == 5
         assert cfg.target_build_success_rate == 0.9  # default
 
-    def test_from_parameters_matches_real_config(self):
+    def test_from_parameters_matches_real_config(self, baseline_params):
         """Config loads correctly from the actual v0.1.0 parameter file."""
-        config_path = PROJECT_ROOT / "context_hub" / "parameters" / "v0.1.0.json"
-        if config_path.exists():
-            with open(config_path) as f:
-                params = json.load(f)
-            cfg = AnalysisConfig.from_parameters(params)
-            assert cfg.analysis_window_size == 10
-            assert cfg.target_build_success_rate == 0.9
-            assert cfg.target_median_cycle_time == 30
+        cfg = AnalysisConfig.from_parameters(baseline_params)
+        assert cfg.analysis_window_size == 10
+        assert cfg.target_build_success_rate == 0.9
+        assert cfg.target_median_cycle_time == 30
 
 
 # ═══════════════════════════════════════
 # AnalysisAgent Tests
 # ═══════════════════════════════════════
 
+# Headings every full report must contain, each on its own line.
+REPORT_SECTIONS = frozenset([
+    "# Observer Analysis Report",
+    "## Findings",
+    "## Metrics Summary",
+    "## Trends",
+    "## Duration Distribution",
+    "## Test Health",
+    "## Run Details",
+])
+
 
-class TestAnalysisAgent:
-    @pytest.fixture
-    def hub(self, tmp_path):
-        return ContextHub(str(tmp_path / "test_hub"))
 
+class TestAnalysisAgent:
     @pytest.fixture
     def config(self):
         return AnalysisConfig(analysis_window_size=5)
@@ -167,6 +173,7 @@ class TestAnalysisAgent:
         assert result.runs_analyzed == 0
         assert result.findings_count == 0
         assert "No runs found" in result.report_content
+        assert result.report_lines == result.report_content.split("\n")
 
     def test_single_run(self, hub, config):
         """Agent works with a single run record."""
@@ -197,36 +204,43 @@ class TestAnalysisAgent:
         analyses = hub.list_analyses()
         assert len(analyses) >= 1
 
-    def test_report_contains_sections(self, hub, config):
-        """Report includes expected markdown sections."""
+    def test_metrics_memoized_until_hub_changes(self, hub, config, monkeypatch):
+        """Repeat runs on an unchanged hub reuse the windowed metrics."""
+        calls = []
+
+        def counting(runs):
+            calls.append(len(runs))
+            return compute_metrics(runs)
+
+        monkeypatch.setattr(analysis_agent_mod, "compute_metrics", counting)
         _seed_hub(hub, 5)
         agent = AnalysisAgent(hub, config)
-        result = agent.run()
+        first = agent.run()
+        second = agent.run()
+        assert len(calls) == 2  # current + previous window, computed once
+        assert first.findings_count == second.findings_count
+
+        hub.write_run(_make_record(
+            "2026-03-01-000001", timestamp="2026-03-01T12:00:00+00:00",
+        ))
+        agent.run()
+        assert len(calls) == 4
 
-        report = result.report_content
-        assert "# Observer Analysis Report" in report
-        assert "## Findings" in report
-        assert "## Metrics Summary" in report
-        assert "## Trends" in report
-        assert "## Duration Distribution" in report
-        assert "## Test Health" in report
-        assert "## Run Details" in report
+    def test_report_contains_sections(self, analysis_result):
+        """Report includes expected markdown sections."""
+        headings = set(analysis_result.report_content.splitlines())
+        missing = REPORT_SECTIONS - headings
+        assert not missing, f"missing sections: {sorted(missing)}"
 
-    def test_duration_seconds_tracked(self, hub, config):
+    def test_duration_seconds_tracked(self, analysis_result):
         """Agent tracks its own execution time."""
-        _seed_hub(hub, 3)
-        agent = AnalysisAgent(hub, config)
-        result = agent.run()
-        assert result.duration_seconds >= 0
-        assert result.duration_seconds < 10  # should be fast
+        assert analysis_result.duration_seconds >= 0
+        assert analysis_result.duration_seconds < 10  # should be fast
 
-    def test_result_summary(self, hub, config):
+    def test_result_summary(self, analysis_result):
         """AnalysisResult.summary provides human-readable output."""
-        _seed_hub(hub, 3)
-        agent = AnalysisAgent(hub, config)
-        result = agent.run()
-        assert "Analyzed" in result.summary
-        assert "findings" in result.summary
+        assert "Analyzed" in analysis_result.summary
+        assert "findings" in analysis_result.summary
 
 
 # ═══════════════════════════════════════
@@ -234,23 +248,62 @@ class TestAnalysisAgent:
 # ═══════════════════════════════════════
 
 
-class TestFindings:
-    @pytest.fixture
-    def hub(self, tmp_path):
-        return ContextHub(str(tmp_path / "test_hub"))
+# (config overrides, seed overrides, expected report substring or None)
+FINDING_CASES = [
+    pytest.param(
+        {}, {"build_success": True}, "all builds succeeded",
+        id="all_passing_info",
+    ),
+    pytest.param(
+        {"target_median_cycle_time": 20.0}, {"duration_minutes": 35.0}, "cycle time",
+        id="slow_cycle_time",
+    ),
+    pytest.param(
+        {"target_manual_intervention_rate": 0.1},
+        {"manual_intervention": True, "manual_intervention_reason": "test reason"},
+        "intervention",
+        id="high_manual_intervention",
+    ),
+    pytest.param(
+        {"target_max_lint_errors": 2}, {"lint_errors": 10}, "lint",
+        id="high_lint_errors",
+    ),
+    pytest.param(
+        {"target_max_type_errors": 0}, {"type_errors": 3}, "type error",
+        id="high_type_errors",
+    ),
+    pytest.param(
+        {
+            "target_build_success_rate": 0.9,
+            "target_median_cycle_time": 50.0,
+            "target_manual_intervention_rate": 0.5,
+            "target_max_lint_errors": 10,
+            "target_max_type_errors": 5,
+        },
+        {},
+        None,
+        id="all_within_targets",
+    ),
+]
 
-    def test_all_passing_generates_info(self, hub):
-        """All-passing runs produce an info finding about success."""
-        config = AnalysisConfig(analysis_window_size=5)
-        _seed_hub(hub, 5, build_success=True)
-        agent = AnalysisAgent(hub, config)
-        result = agent.run()
+
+class TestFindings:
+    @pytest.mark.parametrize("cfg_over,seed_over,expect", FINDING_CASES)
+    def test_finding_generated(self, hub, cfg_over, seed_over, expect):
+        """Each target breach surfaces in the report; none when all within targets."""
+        config = AnalysisConfig(analysis_window_size=5, **cfg_over)
+        _seed_hub(hub, 5, **seed_over)
+        result = AnalysisAgent(hub, config).run()
 
         assert result.success is True
-        assert any(
-            "All builds succeeded" in r
-            for r in result.report_content.split("\n")
-        )
+        report = result.report_content.lower()
+        if expect is None:
+            # Should only have info-level findings (like "all builds succeeded")
+            assert "below target" not in report
+            assert "exceeds target" not in report
+        else:
+            assert result.findings_count >= 1
+            assert expect in report
 
     def test_low_success_rate_generates_critical(self, hub):
         """Build success rate below target triggers critical finding."""
@@ -273,83 +326,6 @@ class TestFindings:
         assert result.findings_count >= 1
         assert "below target" in result.report_content
 
-    def test_slow_cycle_time_generates_warning(self, hub):
-        """Cycle time above target triggers a warning."""
-        config = AnalysisConfig(
-            analysis_window_size=5,
-            target_median_cycle_time=20.0,
-        )
-        _seed_hub(hub, 5, duration_minutes=35.0)
-        agent = AnalysisAgent(hub, config)
-        result = agent.run()
-
-        assert result.findings_count >= 1
-        assert "cycle time" in result.report_content.lower()
-
-    def test_high_manual_intervention_generates_warning(self, hub):
-        """Manual intervention rate above target triggers a warning."""
-        config = AnalysisConfig(
-            analysis_window_size=5,
-            target_manual_intervention_rate=0.1,
-        )
-        # All 5 runs have manual intervention -> 100% rate
-        _seed_hub(
-            hub, 5,
-            manual_intervention=True,
-            manual_intervention_reason="test reason",
-        )
-        agent = AnalysisAgent(hub, config)
-        result = agent.run()
-
-        assert result.findings_count >= 1
-        assert "intervention" in result.report_content.lower()
-
-    def test_high_lint_errors_generates_warning(self, hub):
-        """Lint errors above target triggers a warning."""
-        config = AnalysisConfig(
-            analysis_window_size=5,
-            target_max_lint_errors=2,
-        )
-        _seed_hub(hub, 5, lint_errors=10)
-        agent = AnalysisAgent(hub, config)
-        result = agent.run()
-
-        assert result.findings_count >= 1
-        assert "lint" in result.report_content.lower()
-
-    def test_high_type_errors_generates_warning(self, hub):
-        """Type errors above target triggers a warning."""
-        config = AnalysisConfig(
-            analysis_window_size=5,
-            target_max_type_errors=0,
-        )
-        _seed_hub(hub, 5, type_errors=3)
-        agent = AnalysisAgent(hub, config)
-        result = agent.run()
-
-        assert result.findings_count >= 1
-        assert "type error" in result.report_content.lower()
-
-    def test_no_findings_when_all_within_targets(self, hub):
-        """No warnings/criticals when everything is within targets."""
-        config = AnalysisConfig(
-            analysis_window_size=5,
-            target_build_success_rate=0.9,
-            target_median_cycle_time=50.0,
-            target_manual_intervention_rate=0.5,
-            target_max_lint_errors=10,
-            target_max_type_errors=5,
-        )
-        _seed_hub(hub, 5)
-        agent = AnalysisAgent(hub, config)
-        result = agent.run()
-
-        # Should only have info-level findings (like "all builds succeeded")
-        assert all(
-            "below target" not in line and "exceeds target" not in line
-            for line in result.report_content.split("\n")
-        )
-
 
 # ═══════════════════════════════════════
 # Report Format Tests
@@ -357,37 +333,28 @@ class TestFindings:
 
 
 class TestReportFormat:
-    @pytest.fixture
-    def hub(self, tmp_path):
-        return ContextHub(str(tmp_path / "test_hub"))
-
-    def test_metrics_table_format(self, hub):
+    def test_metrics_table_format(self, analysis_result):
         """Metrics summary table has correct markdown structure."""
-        _seed_hub(hub, 5)
-        config = AnalysisConfig(analysis_window_size=5)
-        agent = AnalysisAgent(hub, config)
-        result = agent.run()
-
-        lines = result.report_content.split("\n")
-        table_header_idx = None
-        for i, line in enumerate(lines):
-            if "| Metric | Value | Target | Status |" in line:
-                table_header_idx = i
-                break
-
-        assert table_header_idx is not None
-        # Separator row follows header
-        assert lines[table_header_idx + 1].startswith("|---")
-
-    def test_run_details_table(self, hub):
+        lines = analysis_result.report_lines
+        start, end = analysis_result.section_spans["Metrics Summary"]
+        assert lines[start] == "## Metrics Summary"
+        # Heading, blank line, then table header and separator row
+        assert lines[start + 2] == "| Metric | Value | Target | Status |"
+        assert lines[start + 3].startswith("|---")
+        assert end > start + 3
+
+    def test_section_spans_partition_report(self, analysis_result):
+        """Section spans are contiguous and line up with report_content."""
+        assert analysis_result.report_lines == analysis_result.report_content.split("\n")
+        spans = list(analysis_result.section_spans.values())
+        for (_, end), (next_start, _) in zip(spans, spans[1:]):
+            assert end == next_start
+        assert analysis_result.report_lines[spans[-1][1]] == "---"
+
+    def test_run_details_table(self, analysis_result):
         """Run details table contains each run."""
-        _seed_hub(hub, 3)
-        config = AnalysisConfig(analysis_window_size=3, include_run_details=True)
-        agent = AnalysisAgent(hub, config)
-        result = agent.run()
-
-        assert "## Run Details" in result.report_content
-        assert "| Run ID |" in result.report_content
+        assert "## Run Details" in analysis_result.report_content
+        assert "| Run ID |" in analysis_result.report_content
 
     def test_run_details_excluded_when_disabled(self, hub):
         """Run details section can be disabled."""
@@ -400,14 +367,9 @@ class TestReportFormat:
 
         assert "## Run Details" not in result.report_content
 
-    def test_report_footer(self, hub):
+    def test_report_footer(self, analysis_result):
         """Report ends with attribution."""
-        _seed_hub(hub, 3)
-        config = AnalysisConfig(analysis_window_size=3)
-        agent = AnalysisAgent(hub, config)
-        result = agent.run()
-
-        assert "Analysis Agent (Phase 2)" in result.report_content
+        assert "Analysis Agent (Phase 2)" in analysis_result.report_content
 
     def test_empty_report_message(self, hub):
         """Empty hub produces a helpful message."""
@@ -425,12 +387,8 @@ class TestReportFormat:
 
 class TestMonitoring:
     @pytest.fixture
-    def hub(self, tmp_path):
-        return ContextHub(str(tmp_path / "test_hub"))
-
-    @pytest.fixture
-    def monitor(self, tmp_path):
-        return AgentMonitor(tmp_path / "test_hub" / "metrics")
+    def monitor(self, hub):
+        return AgentMonitor(hub.metrics_dir)
 
     def test_agent_run_logged(self, hub):
         """Each agent.run() produces a monitoring log entry."""
@@ -609,7 +567,3 @@ class TestEmptyAnalysisReport:
 
         assert handled is True
         assert len(reason) > 0
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
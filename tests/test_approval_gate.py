@@ -10,13 +10,9 @@ Covers:
   - Context Hub proposal read/write
 """
 
+import copy
 import json
-import sys
 import pytest
-from pathlib import Path
-
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
 
 from lib.context_hub import ContextHub
 from lib.analysis_config import AnalysisConfig
@@ -40,30 +36,21 @@ from lib.proposal_engine import (
 # ═══════════════════════════════════════
 
 
-def _seed_params(hub: ContextHub, version: str = "v0.1.0") -> dict:
-    params = {
-        "version": version,
-        "created": "2026-02-06",
-        "targets": {
-            "median_cycle_time_minutes": 30,
-            "build_success_rate": 0.9,
-            "manual_intervention_rate": 0.1,
-            "max_lint_errors_per_run": 5,
-            "max_type_errors_per_run": 0,
-        },
-        "observer": {
-            "analysis_window_size": 10,
-            "trend_threshold": 0.1,
-        },
-    }
+def _seed_params(hub: ContextHub, baseline: dict, version: str = "v0.1.0") -> dict:
+    """Write the baseline parameter config to the hub under `version`."""
+    params = copy.deepcopy(baseline)
+    params["version"] = version
     hub.write_parameters(version, params)
     return params
 
 
-def _create_pending_proposal(hub: ContextHub, config: AnalysisConfig = None) -> Proposal:
-    """Helper to create a pending proposal."""
-    config = config or AnalysisConfig()
-    engine = ProposalEngine(hub, config)
+def _create_pending_proposal(
+    hub: ContextHub,
+    config: AnalysisConfig = None,
+    engine: ProposalEngine = None,
+) -> Proposal:
+    """Helper to create a pending proposal (reusing `engine` if given)."""
+    engine = engine or ProposalEngine(hub, config or AnalysisConfig())
     findings = [
         Finding(Severity.WARNING, "duration",
                 "Median cycle time 35.0m exceeds target 30m"),
@@ -71,44 +58,40 @@ def _create_pending_proposal(hub: ContextHub, config: AnalysisConfig = None) ->
     return engine.generate_proposal(findings)
 
 
+@pytest.fixture
+def seeded_engine(hub, baseline_params):
+    """(engine, proposal): baseline params seeded, one proposal pending."""
+    _seed_params(hub, baseline_params)
+    engine = ProposalEngine(hub)
+    return engine, _create_pending_proposal(hub, engine=engine)
+
+
 # ═══════════════════════════════════════
 # Approval Tests
 # ═══════════════════════════════════════
 
 
 class TestApproval:
-    @pytest.fixture
-    def hub(self, tmp_path):
-        return ContextHub(str(tmp_path / "test_hub"))
-
-    def test_approve_sets_status(self, hub):
-        _seed_params(hub)
-        proposal = _create_pending_proposal(hub)
-        engine = ProposalEngine(hub)
+    def test_approve_sets_status(self, seeded_engine):
+        engine, proposal = seeded_engine
 
         result = engine.approve_proposal(proposal.proposal_id)
         assert result.status == ProposalStatus.APPROVED
 
-    def test_approve_sets_resolved_by(self, hub):
-        _seed_params(hub)
-        proposal = _create_pending_proposal(hub)
-        engine = ProposalEngine(hub)
+    def test_approve_sets_resolved_by(self, seeded_engine):
+        engine, proposal = seeded_engine
 
         result = engine.approve_proposal(proposal.proposal_id, approved_by="tom")
         assert result.resolved_by == "tom"
 
-    def test_approve_sets_resolved_at(self, hub):
-        _seed_params(hub)
-        proposal = _create_pending_proposal(hub)
-        engine = ProposalEngine(hub)
+    def test_approve_sets_resolved_at(self, seeded_engine):
+        engine, proposal = seeded_engine
 
         result = engine.approve_proposal(proposal.proposal_id)
         assert result.resolved_at != ""
 
-    def test_approve_creates_new_parameter_version(self, hub):
-        _seed_params(hub)
-        proposal = _create_pending_proposal(hub)
-        engine = ProposalEngine(hub)
+    def test_approve_creates_new_parameter_version(self, hub, seeded_engine):
+        engine, proposal = seeded_engine
 
         engine.approve_proposal(proposal.proposal_id)
 
@@ -116,10 +99,8 @@ class TestApproval:
         assert new_params is not None
         assert new_params["version"] == proposal.version_to
 
-    def test_approve_applies_diffs_correctly(self, hub):
-        _seed_params(hub)
-        proposal = _create_pending_proposal(hub)
-        engine = ProposalEngine(hub)
+    def test_approve_applies_diffs_correctly(self, hub, seeded_engine):
+        engine, proposal = seeded_engine
 
         engine.approve_proposal(proposal.proposal_id)
 
@@ -127,10 +108,8 @@ class TestApproval:
         # Cycle time should be relaxed from 30 to 33
         assert new_params["targets"]["median_cycle_time_minutes"] == 33.0
 
-    def test_approve_preserves_unmodified_params(self, hub):
-        _seed_params(hub)
-        proposal = _create_pending_proposal(hub)
-        engine = ProposalEngine(hub)
+    def test_approve_preserves_unmodified_params(self, hub, seeded_engine):
+        engine, proposal = seeded_engine
 
         engine.approve_proposal(proposal.proposal_id)
 
@@ -140,10 +119,8 @@ class TestApproval:
         assert new_params["targets"]["max_lint_errors_per_run"] == 5
         assert new_params["observer"]["trend_threshold"] == 0.1
 
-    def test_approve_records_source_proposal(self, hub):
-        _seed_params(hub)
-        proposal = _create_pending_proposal(hub)
-        engine = ProposalEngine(hub)
+    def test_approve_records_source_proposal(self, hub, seeded_engine):
+        engine, proposal = seeded_engine
 
         engine.approve_proposal(proposal.proposal_id)
 
@@ -155,20 +132,16 @@ class TestApproval:
         with pytest.raises(NoProposalFound):
             engine.approve_proposal("does-not-exist")
 
-    def test_cannot_approve_already_approved(self, hub):
-        _seed_params(hub)
-        proposal = _create_pending_proposal(hub)
-        engine = ProposalEngine(hub)
+    def test_cannot_approve_already_approved(self, seeded_engine):
+        engine, proposal = seeded_engine
 
         engine.approve_proposal(proposal.proposal_id)
 
         with pytest.raises(ProposalNotPending):
             engine.approve_proposal(proposal.proposal_id)
 
-    def test_cannot_approve_rejected(self, hub):
-        _seed_params(hub)
-        proposal = _create_pending_proposal(hub)
-        engine = ProposalEngine(hub)
+    def test_cannot_approve_rejected(self, seeded_engine):
+        engine, proposal = seeded_engine
 
         engine.reject_proposal(proposal.proposal_id)
 
@@ -182,22 +155,14 @@ class TestApproval:
 
 
 class TestRejection:
-    @pytest.fixture
-    def hub(self, tmp_path):
-        return ContextHub(str(tmp_path / "test_hub"))
-
-    def test_reject_sets_status(self, hub):
-        _seed_params(hub)
-        proposal = _create_pending_proposal(hub)
-        engine = ProposalEngine(hub)
+    def test_reject_sets_status(self, seeded_engine):
+        engine, proposal = seeded_engine
 
         result = engine.reject_proposal(proposal.proposal_id)
         assert result.status == ProposalStatus.REJECTED
 
-    def test_reject_records_reason(self, hub):
-        _seed_params(hub)
-        proposal = _create_pending_proposal(hub)
-        engine = ProposalEngine(hub)
+    def test_reject_records_reason(self, seeded_engine):
+        engine, proposal = seeded_engine
 
         result = engine.reject_proposal(
             proposal.proposal_id,
@@ -205,20 +170,16 @@ class TestRejection:
         )
         assert result.rejection_reason == "Not appropriate at this time"
 
-    def test_reject_records_who(self, hub):
-        _seed_params(hub)
-        proposal = _create_pending_proposal(hub)
-        engine = ProposalEngine(hub)
+    def test_reject_records_who(self, seeded_engine):
+        engine, proposal = seeded_engine
 
         result = engine.reject_proposal(
             proposal.proposal_id, rejected_by="tom"
         )
         assert result.resolved_by == "tom"
 
-    def test_reject_does_not_create_parameters(self, hub):
-        _seed_params(hub)
-        proposal = _create_pending_proposal(hub)
-        engine = ProposalEngine(hub)
+    def test_reject_does_not_create_parameters(self, hub, seeded_engine):
+        engine, proposal = seeded_engine
 
         engine.reject_proposal(proposal.proposal_id)
 
@@ -231,18 +192,16 @@ class TestRejection:
         with pytest.raises(NoProposalFound):
             engine.reject_proposal("does-not-exist")
 
-    def test_cannot_reject_already_rejected(self, hub):
-        _seed_params(hub)
-        proposal = _create_pending_proposal(hub)
-        engine = ProposalEngine(hub)
+    def test_cannot_reject_already_rejected(self, seeded_engine):
+        engine, proposal = seeded_engine
 
         engine.reject_proposal(proposal.proposal_id)
         with pytest.raises(ProposalNotPending):
             engine.reject_proposal(proposal.proposal_id)
 
-    def test_reject_then_new_proposal_allowed(self, hub):
+    def test_reject_then_new_proposal_allowed(self, hub, baseline_params):
         """After rejecting, a new proposal can be created."""
-        _seed_params(hub)
+        _seed_params(hub, baseline_params)
         engine = ProposalEngine(hub)
 
         findings = [
@@ -263,25 +222,19 @@ class TestRejection:
 
 
 class TestProposalListing:
-    @pytest.fixture
-    def hub(self, tmp_path):
-        return ContextHub(str(tmp_path / "test_hub"))
-
     def test_list_empty(self, hub):
         engine = ProposalEngine(hub)
         assert engine.list_all_proposals() == []
 
-    def test_list_pending(self, hub):
-        _seed_params(hub)
-        proposal = _create_pending_proposal(hub)
-        engine = ProposalEngine(hub)
+    def test_list_pending(self, seeded_engine):
+        engine, proposal = seeded_engine
 
         pending = engine.pending_proposals()
         assert len(pending) == 1
         assert pending[0].proposal_id == proposal.proposal_id
 
-    def test_list_all_includes_resolved(self, hub):
-        _seed_params(hub)
+    def test_list_all_includes_resolved(self, hub, baseline_params):
+        _seed_params(hub, baseline_params)
         engine = ProposalEngine(hub)
 
         findings = [
@@ -300,9 +253,9 @@ class TestProposalListing:
         pending = engine.pending_proposals()
         assert len(pending) == 0
 
-    def test_context_hub_read_proposal(self, hub):
+    def test_context_hub_read_proposal(self, hub, baseline_params):
         """ContextHub.read_proposal returns correct data."""
-        _seed_params(hub)
+        _seed_params(hub, baseline_params)
         proposal = _create_pending_proposal(hub)
 
         data = hub.read_proposal(proposal.proposal_id)
@@ -313,7 +266,3 @@ class TestProposalListing:
     def test_context_hub_read_nonexistent_proposal(self, hub):
         """ContextHub.read_proposal returns None for missing proposals."""
         assert hub.read_proposal("nonexistent") is None
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
@@ -6,13 +6,8 @@ Verifies that write_run() rejects invalid records at write time
 via validate_run_record() integration.
 """
 
-import sys
 import tempfile
 import pytest
-from pathlib import Path
-
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
 
 from lib.schema import RunRecord, current_timestamp
 from lib.context_hub import ContextHub, ValidationError, RecordExistsError
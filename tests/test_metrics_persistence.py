@@ -1,13 +1,10 @@
 """Tests for lib/metrics_persistence.py — snapshot writer."""
 
 import json
-import sys
 from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
 from lib.metrics_persistence import persist_snapshot
 
 
@@ -32,6 +29,8 @@ class TestPersistSnapshot:
         assert data["run_count"] == 5
         assert data["duration_mean"] == 12.5
         assert "snapshot_timestamp" in data
+        assert "snapshot_timestamp" not in metrics  # caller's dict untouched
+        assert list(Path(path).parent.glob("*.tmp")) == []
 
     def test_timestamp_in_filename(self, tmp_path):
         hub_path = str(tmp_path / "hub")
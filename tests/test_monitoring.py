@@ -1,13 +1,8 @@
 """Tests for lib/monitoring.py — retention policy (OBS-006)."""
 
 import json
-import sys
 import pytest
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
-
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
 
 from lib.monitoring import AgentMonitor, AgentRunLog, DEFAULT_RETENTION_DAYS
 
@@ -58,3 +53,29 @@ class TestRetentionPolicy:
         purged = monitor.purge_old_logs()
         assert purged == 2
         assert monitor.run_count() == 1
+
+
+class TestPerEntryAppend:
+    def test_entries_visible_to_other_monitor(self, tmp_path):
+        writer = AgentMonitor(tmp_path)
+        writer.log_run(_make_entry())
+        writer.log_run(_make_entry())
+
+        reader = AgentMonitor(tmp_path)
+        assert reader.run_count() == 2
+
+    def test_entry_on_disk_after_log_run(self, tmp_path):
+        monitor = AgentMonitor(tmp_path)
+        monitor.log_run(_make_entry())
+        lines = monitor.log_path.read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["agent_name"] == "analysis_agent"
+
+    def test_recreates_log_after_removal(self, tmp_path):
+        monitor = AgentMonitor(tmp_path)
+        monitor.log_run(_make_entry())
+        assert monitor.run_count() == 1
+
+        monitor.log_path.unlink()
+        monitor.log_run(_make_entry())
+        assert monitor.run_count() == 1
@@ -12,15 +12,13 @@ Covers:
   - Trend computation
 """
 
+import dataclasses
 import json
 import os
-import sys
+import shutil
+import statistics
 import tempfile
 import pytest
-from pathlib import Path
-
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
 
 from lib.schema import (
     RunRecord,
@@ -29,6 +27,7 @@ from lib.schema import (
     generate_run_id,
     current_timestamp,
     validate_run_record,
+    validate_many,
 )
 from lib.context_hub import ContextHub, RecordExistsError, ValidationError
 from lib.metrics import compute_metrics, compute_trends, MetricsSummary
@@ -51,6 +50,12 @@ class TestRunRecord:
         with pytest.raises(AttributeError):
             r.run_id = "modified"  # frozen=True should prevent this
 
+    def test_no_instance_dict(self):
+        r = RunRecord(run_id="test-001", timestamp=current_timestamp())
+        assert not hasattr(r, "__dict__")  # slots=True
+        with pytest.raises((AttributeError, TypeError)):
+            r.extra = "x"
+
     def test_serialization_roundtrip(self):
         r = RunRecord(
             run_id="test-002",
@@ -84,6 +89,19 @@ class TestRunRecord:
         d = r.to_dict()
         assert isinstance(d["pipeline_steps_executed"], list)
 
+    def test_to_dict_matches_asdict(self):
+        r = RunRecord(
+            run_id="test-003b",
+            timestamp=current_timestamp(),
+            pipeline_steps_executed=("build",),
+            step_timings=(("build", 1.5),),
+        )
+        expected = dataclasses.asdict(r)
+        expected["pipeline_steps_executed"] = ["build"]
+        expected["step_timings"] = [("build", 1.5)]
+        assert r.to_dict() == expected
+        assert list(r.to_dict()) == list(expected)  # field order preserved
+
     def test_from_dict_ignores_unknown_fields(self):
         """Forward compatibility: unknown fields don't crash deserialization."""
         data = {
@@ -147,6 +165,29 @@ class TestValidation:
         issues = validate_run_record(r)
         assert any("nonexistent" in i for i in issues)
 
+    def test_validate_many_matches_scalar(self):
+        ts = current_timestamp()
+        records = [
+            RunRecord(run_id="ok-1", timestamp=ts),
+            RunRecord(run_id="bad-1", timestamp=ts, tests_failed=-1, input_type="INVALID"),
+            RunRecord(run_id="ok-2", timestamp=ts),
+            RunRecord(run_id="bad-2", timestamp="not-a-date", cost_usd=-0.5),
+        ]
+        result = validate_many(records)
+        assert set(result) == {"bad-1", "bad-2"}
+        for r in records[1::2]:
+            assert result[r.run_id] == validate_run_record(r)
+
+    def test_validate_many_all_valid(self):
+        ts = current_timestamp()
+        records = [RunRecord(run_id=f"ok-{i}", timestamp=ts) for i in range(3)]
+        assert validate_many(records) == {}
+
+    def test_validate_many_accepts_generator(self):
+        ts = current_timestamp()
+        records = [RunRecord(run_id="ok-1", timestamp=ts), RunRecord(run_id="bad-1", timestamp=ts, lint_errors=-1)]
+        assert set(validate_many(r for r in records)) == {"bad-1"}
+
 
 class TestGenerateRunId:
     def test_format(self):
@@ -188,6 +229,12 @@ class TestContextHub:
         assert hub.proposals_dir.exists()
         assert hub.parameters_dir.exists()
 
+    def test_reopening_removed_root_recreates_dirs(self, hub):
+        shutil.rmtree(hub.base_path)
+        again = ContextHub(str(hub.base_path))
+        again.write_run(self._make_record("test-reopen-001"))
+        assert again.run_count() == 1
+
     def test_write_and_read(self, hub):
         record = self._make_record("test-write-001")
         hub.write_run(record)
@@ -208,6 +255,38 @@ class TestContextHub:
         with pytest.raises(ValidationError):
             hub.write_run(bad_record)
 
+    def test_write_runs_batch(self, hub):
+        records = [self._make_record(f"batch-{i:03d}") for i in range(3)]
+        paths = hub.write_runs(records)
+        assert [p.stem for p in paths] == ["batch-000", "batch-001", "batch-002"]
+        assert hub.run_count() == 3
+
+    def test_write_runs_accepts_generator(self, hub):
+        paths = hub.write_runs(self._make_record(f"gen-{i:03d}") for i in range(3))
+        assert [p.stem for p in paths] == ["gen-000", "gen-001", "gen-002"]
+        assert hub.run_count() == 3
+
+    def test_write_runs_is_all_or_nothing(self, hub):
+        hub.write_run(self._make_record("batch-dup"))
+        records = [self._make_record("batch-new"), self._make_record("batch-dup")]
+        with pytest.raises(RecordExistsError):
+            hub.write_runs(records)
+        with pytest.raises(ValidationError):
+            hub.write_runs([self._make_record("batch-ok"), RunRecord(run_id="", timestamp="")])
+        assert hub.run_count() == 1
+
+    def test_durable_writes_fsync_once_per_batch_dir(self, hub, monkeypatch):
+        synced = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd) or real_fsync(fd))
+
+        hub.write_runs([self._make_record(f"fast-{i}") for i in range(3)])
+        assert synced == []
+
+        hub.write_runs([self._make_record(f"durable-{i}") for i in range(3)], durable=True)
+        assert len(synced) == 4  # three records + one runs-dir sync
+        assert hub.run_count() == 6
+
     def test_read_nonexistent(self, hub):
         assert hub.read_run("does-not-exist") is None
 
@@ -232,12 +311,29 @@ class TestContextHub:
 
         runs = hub.list_runs(limit=3)
         assert len(runs) == 3
+        assert [r.run_id for r in runs] == [
+            "2026-01-19-bbbbbb", "2026-01-18-bbbbbb", "2026-01-17-bbbbbb",
+        ]
+        oldest = hub.list_runs(limit=2, newest_first=False)
+        assert [r.run_id for r in oldest] == ["2026-01-10-bbbbbb", "2026-01-11-bbbbbb"]
+        # Negative limits slice like a list: all but the oldest run
+        assert len(hub.list_runs(limit=-1)) == 9
+        assert hub.list_run_ids(limit=-1)[-1] == "2026-01-11-bbbbbb"
+
+    def test_list_run_ids_matches_list_runs(self, hub):
+        hub.write_runs([self._make_record(f"2026-01-{i+10:02d}-cccccc") for i in range(5)])
+        for kwargs in ({}, {"limit": 2}, {"newest_first": False, "limit": 3}):
+            assert hub.list_run_ids(**kwargs) == [r.run_id for r in hub.list_runs(**kwargs)]
 
     def test_run_count(self, hub):
         assert hub.run_count() == 0
         hub.write_run(self._make_record("count-001"))
         hub.write_run(self._make_record("count-002"))
         assert hub.run_count() == 2
+        # In-flight temp files and dotfiles are not runs
+        (hub.runs_dir / "count-003.tmp").write_text("{}")
+        (hub.runs_dir / ".hidden.json").write_text("{}")
+        assert hub.run_count() == 2
 
     def test_run_exists(self, hub):
         hub.write_run(self._make_record("exists-001"))
@@ -261,6 +357,17 @@ class TestContextHub:
         latest = hub.latest_parameters()
         assert latest["version"] == 2
 
+    def test_latest_parameters_tracks_new_versions(self, hub):
+        hub.write_parameters("v001", {"version": 1})
+        assert hub.latest_parameters()["version"] == 1
+        hub.write_parameters("v002", {"version": 2})
+        assert hub.latest_parameters()["version"] == 2
+        # Added by another writer, not through this hub, in the same mtime tick
+        (hub.parameters_dir / "v003.json").write_text(json.dumps({"version": 3}))
+        assert hub.latest_parameters()["version"] == 3
+        (hub.parameters_dir / "v003.json").unlink()
+        assert hub.latest_parameters()["version"] == 2
+
 
 # ═══════════════════════════════════════
 # Metrics Tests
@@ -301,6 +408,17 @@ class TestMetrics:
         assert s.duration_median > 0
         assert s.total_tests_passed > 0
 
+    def test_duration_and_count_columns(self):
+        runs = self._make_runs(5)
+        s = compute_metrics(runs)
+        durations = [r.duration_minutes for r in runs]
+        assert s.duration_mean == 32.0
+        assert s.duration_stddev == round(statistics.stdev(durations), 2)
+        assert s.date_range_start == "2026-02-01T12:00:00+00:00"
+        assert s.date_range_end == "2026-02-05T12:00:00+00:00"
+        assert s.manual_intervention_rate == 0.2
+        assert s.total_diff_lines == sum(r.diff_size_lines for r in runs)
+
     def test_success_rate_with_failures(self):
         runs = self._make_runs(4)
         # Override one to fail
@@ -319,6 +437,18 @@ class TestMetrics:
         s = compute_metrics(runs)
         assert s.manual_intervention_rate == 0.2  # 1/5
 
+    def test_null_flags_count_as_false(self):
+        runs = self._make_runs(4)
+        runs.append(RunRecord(
+            run_id="metric-null",
+            timestamp=current_timestamp(),
+            build_success=None,
+            manual_intervention=None,
+        ))
+        s = compute_metrics(runs)
+        assert s.build_success_rate == 0.8
+        assert s.manual_intervention_rate == 0.2
+
     def test_trend_improving(self):
         prev = MetricsSummary(
             run_count=5,
@@ -360,7 +490,3 @@ class TestMetrics:
         curr = MetricsSummary(run_count=5, duration_mean=30.0)
         result = compute_trends(curr, prev)
         assert result.duration_trend == "insufficient_data"
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
@@ -1,13 +1,8 @@
 """Tests for bin/phase4_readiness.py — OBS-001 variance and trend checks."""
 
-import sys
 import pytest
-from pathlib import Path
 from unittest.mock import MagicMock
 
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
-
 from bin.phase4_readiness import (
     _check_approval_rate_variance,
     _check_trend_not_degrading,
@@ -17,23 +12,25 @@ from lib.schema import RunRecord, current_timestamp
 
 def _make_proposals(risk_status_pairs):
     """Build proposal dicts from (risk_level, status) pairs."""
+    created_at = current_timestamp()  # one stamp per batch
     proposals = []
     for i, (risk, status) in enumerate(risk_status_pairs):
         proposals.append({
             "id": f"prop-{i}",
             "status": status,
             "risk_assessment": risk,
-            "created_at": current_timestamp(),
+            "created_at": created_at,
         })
     return proposals
 
 
 def _make_runs(n, build_success=True, duration=5.0):
     """Build a list of RunRecord objects."""
+    ts = current_timestamp()  # one stamp per batch
     return [
         RunRecord(
             run_id=f"run-{i:03d}",
-            timestamp=current_timestamp(),
+            timestamp=ts,
             build_success=build_success,
             duration_minutes=duration,
         )
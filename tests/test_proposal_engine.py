@@ -10,17 +10,12 @@ Covers:
   - Parameter application on approval
 """
 
+import dataclasses
 import json
-import sys
 import pytest
-from pathlib import Path
-
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
 
 from lib.schema import RunRecord, current_timestamp
 from lib.context_hub import ContextHub
-from lib.metrics import compute_metrics
 from lib.analysis_config import AnalysisConfig
 from lib.analysis_agent import AnalysisAgent, Finding, Severity
 from lib.proposal_schema import (
@@ -45,65 +40,60 @@ from lib.proposal_engine import (
 # ═══════════════════════════════════════
 
 
+_RECORD_DEFAULTS = {
+    "timestamp": "2026-02-06T12:00:00+00:00",
+    "build_success": True,
+    "duration_minutes": 25.0,
+    "tests_passed": 40,
+    "tests_failed": 0,
+    "lint_errors": 0,
+    "type_errors": 0,
+    "input_type": "PRD",
+}
+
+# v0.1.0 defaults seeded into every engine test's parameter store.
+_SEED_PARAMS = {
+    "version": "v0.1.0",
+    "created": "2026-02-06",
+    "targets": {
+        "median_cycle_time_minutes": 30,
+        "build_success_rate": 0.9,
+        "manual_intervention_rate": 0.1,
+        "max_lint_errors_per_run": 5,
+        "max_type_errors_per_run": 0,
+    },
+    "observer": {
+        "analysis_window_size": 10,
+        "trend_threshold": 0.1,
+    },
+}
+
+
 def _make_record(run_id: str, **kwargs) -> RunRecord:
-    defaults = {
-        "run_id": run_id,
-        "timestamp": "2026-02-06T12:00:00+00:00",
-        "build_success": True,
-        "duration_minutes": 25.0,
-        "tests_passed": 40,
-        "tests_failed": 0,
-        "lint_errors": 0,
-        "type_errors": 0,
-        "input_type": "PRD",
-    }
-    defaults.update(kwargs)
-    return RunRecord(**defaults)
+    return RunRecord(**{**_RECORD_DEFAULTS, "run_id": run_id, **kwargs})
 
 
 def _seed_hub(hub: ContextHub, n: int, **overrides) -> list[RunRecord]:
+    """Seed a hub with n run records in one batch and return them."""
     records = []
     for i in range(n):
         day = min(i + 1, 28)
-        defaults = {
-            "run_id": f"2026-02-{day:02d}-{i:06x}",
-            "timestamp": f"2026-02-{day:02d}T12:00:00+00:00",
-            "build_success": True,
+        records.append(RunRecord(**{
+            **_RECORD_DEFAULTS,
             "duration_minutes": 25.0 + i,
             "tests_passed": 40 + i,
-            "tests_failed": 0,
             "lint_errors": i % 3,
-            "type_errors": 0,
-            "input_type": "PRD",
-        }
-        defaults.update(overrides)
-        defaults["run_id"] = f"2026-02-{day:02d}-{i:06x}"
-        defaults["timestamp"] = f"2026-02-{day:02d}T12:00:00+00:00"
-        r = RunRecord(**defaults)
-        hub.write_run(r)
-        records.append(r)
+            **overrides,
+            "run_id": f"2026-02-{day:02d}-{i:06x}",
+            "timestamp": f"2026-02-{day:02d}T12:00:00+00:00",
+        }))
+    hub.write_runs(records)
     return records
 
 
-def _seed_params(hub: ContextHub) -> dict:
+def _seed_params(hub: ContextHub) -> None:
     """Seed the parameter store with v0.1.0 defaults."""
-    params = {
-        "version": "v0.1.0",
-        "created": "2026-02-06",
-        "targets": {
-            "median_cycle_time_minutes": 30,
-            "build_success_rate": 0.9,
-            "manual_intervention_rate": 0.1,
-            "max_lint_errors_per_run": 5,
-            "max_type_errors_per_run": 0,
-        },
-        "observer": {
-            "analysis_window_size": 10,
-            "trend_threshold": 0.1,
-        },
-    }
-    hub.write_parameters("v0.1.0", params)
-    return params
+    hub.write_parameters("v0.1.0", _SEED_PARAMS)
 
 
 # ═══════════════════════════════════════
@@ -183,6 +173,40 @@ class TestProposalSchema:
         assert restored.new_value == diff.new_value
         assert restored.reason == diff.reason
 
+    def test_diff_by_path_and_add_diff(self):
+        first = ParameterDiff("targets.build_success_rate", 0.9, 0.85)
+        p = Proposal(
+            proposal_id="prop-test-004",
+            created_at="2026-02-08T12:00:00+00:00",
+            parameter_diffs=[first],
+        )
+        assert p.diff_by_path("targets.build_success_rate") is first
+        assert p.diff_by_path("targets.missing") is None
+        # First diff per path wins
+        assert p.add_diff(ParameterDiff("targets.build_success_rate", 0.9, 0.8)) is False
+        assert p.add_diff(ParameterDiff("targets.max_lint_errors_per_run", 5, 7)) is True
+        assert p.diff_count == 2
+        restored = Proposal.from_json(p.to_json())
+        assert restored.diff_by_path("targets.max_lint_errors_per_run").new_value == 7
+        assert restored == p
+
+    def test_diff_index_is_not_a_field(self):
+        p = Proposal(proposal_id="prop-test-005", created_at="2026-02-08T12:00:00+00:00")
+        assert "_diffs_by_path" not in {f.name for f in dataclasses.fields(Proposal)}
+        assert "_diffs_by_path" not in dataclasses.asdict(p)
+
+    def test_diff_by_path_sees_direct_list_changes(self):
+        p = Proposal(proposal_id="prop-test-006", created_at="2026-02-08T12:00:00+00:00")
+        appended = ParameterDiff("targets.build_success_rate", 0.9, 0.85)
+        p.parameter_diffs.append(appended)
+        assert p.diff_by_path("targets.build_success_rate") is appended
+        assert p.add_diff(ParameterDiff("targets.build_success_rate", 0.9, 0.8)) is False
+
+        replacement = ParameterDiff("targets.max_lint_errors_per_run", 5, 7)
+        p.parameter_diffs = [replacement]
+        assert p.diff_by_path("targets.build_success_rate") is None
+        assert p.diff_by_path("targets.max_lint_errors_per_run") is replacement
+
     def test_generate_proposal_id_format(self):
         pid = generate_proposal_id()
         assert pid.startswith("prop-")
@@ -253,6 +277,14 @@ class TestImpactComputation:
         findings = [Finding(Severity.CRITICAL, "reliability", "bad")]
         assert compute_impact(diffs, findings) == ImpactLevel.HIGH
 
+    def test_critical_with_many_changes_is_high(self):
+        diffs = [ParameterDiff(p, 1, 2) for p in ("a", "b", "c")]
+        findings = [Finding(Severity.CRITICAL, "reliability", "bad")]
+        assert compute_impact(diffs, findings) == ImpactLevel.HIGH
+
+    def test_no_findings_no_changes_is_low(self):
+        assert compute_impact([], []) == ImpactLevel.LOW
+
 
 # ═══════════════════════════════════════
 # Proposal Engine Tests
@@ -260,10 +292,6 @@ class TestImpactComputation:
 
 
 class TestProposalEngine:
-    @pytest.fixture
-    def hub(self, tmp_path):
-        return ContextHub(str(tmp_path / "test_hub"))
-
     @pytest.fixture
     def config(self):
         return AnalysisConfig(analysis_window_size=5)
@@ -278,6 +306,27 @@ class TestProposalEngine:
         proposal = engine.generate_proposal(findings)
         assert proposal is None
 
+    def test_apply_diffs_copies_only_changed_paths(self, hub, config):
+        engine = ProposalEngine(hub, config)
+        params = {
+            "targets": {"median_cycle_time_minutes": 30, "build_success_rate": 0.9},
+            "thresholds": {"lint": 5},
+        }
+        diffs = [
+            ParameterDiff("targets.median_cycle_time_minutes", 30, 33),
+            ParameterDiff("targets.build_success_rate", 0.9, 0.85),
+            ParameterDiff("new.section.value", None, 1),
+        ]
+        result = engine._apply_diffs(params, diffs)
+
+        assert result["targets"] == {
+            "median_cycle_time_minutes": 33, "build_success_rate": 0.85,
+        }
+        assert result["new"] == {"section": {"value": 1}}
+        assert params["targets"]["median_cycle_time_minutes"] == 30
+        assert "new" not in params
+        assert result["thresholds"] is params["thresholds"]
+
     def test_proposal_from_slow_cycle_time(self, hub, config):
         """Slow cycle time finding -> propose relaxing target."""
         _seed_params(hub)
@@ -291,10 +340,9 @@ class TestProposalEngine:
         assert proposal.is_pending
         assert proposal.diff_count >= 1
         # Check the diff
-        cycle_diff = [d for d in proposal.parameter_diffs
-                      if d.path == "targets.median_cycle_time_minutes"]
-        assert len(cycle_diff) == 1
-        assert cycle_diff[0].new_value == 33.0  # 30 * 1.1
+        cycle_diff = proposal.diff_by_path("targets.median_cycle_time_minutes")
+        assert cycle_diff is not None
+        assert cycle_diff.new_value == 33.0  # 30 * 1.1
 
     def test_proposal_from_low_success_rate(self, hub, config):
         """Low build success rate -> propose lowering target."""
@@ -306,10 +354,9 @@ class TestProposalEngine:
         ]
         proposal = engine.generate_proposal(findings)
         assert proposal is not None
-        rate_diff = [d for d in proposal.parameter_diffs
-                     if d.path == "targets.build_success_rate"]
-        assert len(rate_diff) == 1
-        assert rate_diff[0].new_value == 0.85  # 0.9 - 0.05
+        rate_diff = proposal.diff_by_path("targets.build_success_rate")
+        assert rate_diff is not None
+        assert rate_diff.new_value == 0.85  # 0.9 - 0.05
 
     def test_proposal_from_high_lint(self, hub, config):
         """High lint errors -> propose raising tolerance."""
@@ -321,10 +368,9 @@ class TestProposalEngine:
         ]
         proposal = engine.generate_proposal(findings)
         assert proposal is not None
-        lint_diff = [d for d in proposal.parameter_diffs
-                     if d.path == "targets.max_lint_errors_per_run"]
-        assert len(lint_diff) == 1
-        assert lint_diff[0].new_value == 7  # 5 + 2
+        lint_diff = proposal.diff_by_path("targets.max_lint_errors_per_run")
+        assert lint_diff is not None
+        assert lint_diff.new_value == 7  # 5 + 2
 
     def test_proposal_from_high_type_errors(self, hub, config):
         """High type errors -> propose raising tolerance."""
@@ -336,10 +382,9 @@ class TestProposalEngine:
         ]
         proposal = engine.generate_proposal(findings)
         assert proposal is not None
-        type_diff = [d for d in proposal.parameter_diffs
-                     if d.path == "targets.max_type_errors_per_run"]
-        assert len(type_diff) == 1
-        assert type_diff[0].new_value == 1  # 0 + 1
+        type_diff = proposal.diff_by_path("targets.max_type_errors_per_run")
+        assert type_diff is not None
+        assert type_diff.new_value == 1  # 0 + 1
 
     def test_proposal_from_manual_intervention(self, hub, config):
         """High manual intervention -> propose relaxing target."""
@@ -351,10 +396,9 @@ class TestProposalEngine:
         ]
         proposal = engine.generate_proposal(findings)
         assert proposal is not None
-        mi_diff = [d for d in proposal.parameter_diffs
-                   if d.path == "targets.manual_intervention_rate"]
-        assert len(mi_diff) == 1
-        assert mi_diff[0].new_value == 0.15  # 0.1 + 0.05
+        mi_diff = proposal.diff_by_path("targets.manual_intervention_rate")
+        assert mi_diff is not None
+        assert mi_diff.new_value == 0.15  # 0.1 + 0.05
 
     def test_proposal_persisted(self, hub, config):
         """Proposal is written to context_hub/proposals/."""
@@ -447,10 +491,6 @@ class TestProposalEngine:
 
 
 class TestEndToEnd:
-    @pytest.fixture
-    def hub(self, tmp_path):
-        return ContextHub(str(tmp_path / "test_hub"))
-
     def test_analyze_then_propose(self, hub):
         """Full pipeline: seed data -> analyze -> propose."""
         _seed_params(hub)
@@ -466,18 +506,14 @@ class TestEndToEnd:
         result = agent.run()
         assert result.success
 
-        # Extract findings
-        runs = hub.list_runs(limit=10, newest_first=True)
-        current_runs = runs[:5]
-        from lib.metrics import compute_metrics, compute_trends
-        current_metrics = compute_metrics(current_runs)
-        previous_metrics = compute_metrics([])
-        metrics_with_trends = compute_trends(current_metrics, previous_metrics)
-        findings = agent._analyze(current_runs, metrics_with_trends, previous_metrics)
+        assert len(result.findings) == result.findings_count
+        assert result.metrics_with_trends.run_count == 5
 
         # Generate proposal
         engine = ProposalEngine(hub, config)
-        proposal = engine.generate_proposal(findings, source_report=result.report_filename)
+        proposal = engine.generate_proposal(
+            result.findings, source_report=result.report_filename
+        )
         assert proposal is not None
         assert proposal.is_pending
 
@@ -529,18 +565,16 @@ class TestEndToEnd:
 class TestRuleRegistry:
     """Tests for rule registry (OBS-003)."""
 
-    def test_registry_contains_default_rules(self, tmp_path):
+    def test_registry_contains_default_rules(self, hub):
         """Engine initializes with all 6 default rules registered."""
-        hub = ContextHub(str(tmp_path / "hub"))
         engine = ProposalEngine(hub)
         assert "slow_cycle_time" in engine._rule_registry
         assert "low_success_rate" in engine._rule_registry
         assert "high_lint" in engine._rule_registry
         assert len(engine._rule_registry) == 6
 
-    def test_register_rule_adds_new_rule(self, tmp_path):
+    def test_register_rule_adds_new_rule(self, hub):
         """register_rule() adds a custom rule to the registry."""
-        hub = ContextHub(str(tmp_path / "hub"))
         engine = ProposalEngine(hub)
         custom_rule = lambda f, c, p: None
         engine.register_rule("custom_check", custom_rule)
@@ -548,17 +582,15 @@ class TestRuleRegistry:
         assert engine._rule_registry["custom_check"] is custom_rule
         assert len(engine._rule_registry) == 7
 
-    def test_unregister_rule_removes_rule(self, tmp_path):
+    def test_unregister_rule_removes_rule(self, hub):
         """unregister_rule() removes a rule from the registry."""
-        hub = ContextHub(str(tmp_path / "hub"))
         engine = ProposalEngine(hub)
         engine.unregister_rule("high_lint")
         assert "high_lint" not in engine._rule_registry
         assert len(engine._rule_registry) == 5
 
-    def test_execution_loop_calls_registered_rules(self, tmp_path):
+    def test_execution_loop_calls_registered_rules(self, hub):
         """generate_proposal() iterates over registry, not hardcoded RULES."""
-        hub = ContextHub(str(tmp_path / "hub"))
         engine = ProposalEngine(hub)
 
         call_log = []
@@ -575,6 +607,23 @@ class TestRuleRegistry:
         engine.generate_proposal(findings)
         assert "test_cat" in call_log
 
+    def test_tagged_rules_only_see_their_categories(self, hub):
+        """Category-tagged rules are skipped for other findings; untagged rules are not."""
+        engine = ProposalEngine(hub)
+        seen = {"tagged": [], "untagged": []}
+
+        def tagged(finding, config, params):
+            seen["tagged"].append(finding.category)
+        tagged.categories = frozenset({"duration"})
 
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+        def untagged(finding, config, params):
+            seen["untagged"].append(finding.category)
+
+        engine._rule_registry.clear()
+        engine.register_rule("tagged", tagged)
+        engine.register_rule("untagged", untagged)
+        engine.generate_proposal([
+            Finding(Severity.WARNING, "duration", "slow"),
+            Finding(Severity.WARNING, "hygiene", "lint"),
+        ])
+        assert seen == {"tagged": ["duration"], "untagged": ["duration", "hygiene"]}
@@ -1,11 +1,6 @@
 """Tests for lib/repo_filter.py — repo-level run filtering."""
 
-import sys
-from pathlib import Path
-from unittest.mock import MagicMock
-
-# Ensure project root is on path
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from types import SimpleNamespace
 
 from lib.repo_filter import list_runs_by_repo, list_repos, runs_by_repo_summary
 from lib.schema import RunRecord, generate_run_id, current_timestamp
@@ -20,10 +15,13 @@ def _make_run(repo_id="", timestamp=None):
     )
 
 
+class _LegacyRun:
+    """Stand-in for a record that predates repo_id (no attributes at all)."""
+    __slots__ = ()
+
+
 def _hub_with_runs(runs):
-    hub = MagicMock()
-    hub.list_runs.return_value = runs
-    return hub
+    return SimpleNamespace(list_runs=lambda *args, **kwargs: runs)
 
 
 class TestListRunsByRepo:
@@ -54,8 +52,7 @@ class TestListRunsByRepo:
 
     def test_handles_records_without_repo_id_attr(self):
         """Legacy records may lack repo_id attribute entirely."""
-        legacy = MagicMock(spec=[])  # no attributes
-        hub = _hub_with_runs([legacy])
+        hub = _hub_with_runs([_LegacyRun()])
         result = list_runs_by_repo(hub, "")
         assert len(result) == 1
 
@@ -86,6 +83,30 @@ class TestRunsByRepoSummary:
         assert result["org/a"]["latest"] == "2025-01-02T10:00:00+00:00"
         assert result["org/b"]["count"] == 1
 
+    def test_latest_ignores_missing_timestamps(self):
+        runs = [
+            RunRecord(run_id="r-1", repo_id="org/a", timestamp=""),
+            _make_run("org/a", timestamp="2025-01-01T10:00:00+00:00"),
+            RunRecord(run_id="r-2", repo_id="org/b", timestamp=""),
+        ]
+        result = runs_by_repo_summary(_hub_with_runs(runs))
+        assert result == {
+            "org/a": {"count": 2, "latest": "2025-01-01T10:00:00+00:00"},
+            "org/b": {"count": 1, "latest": ""},
+        }
+
+    def test_latest_ignores_null_timestamps(self):
+        runs = [
+            RunRecord(run_id="r-1", repo_id="org/a", timestamp=None),
+            _make_run("org/a", timestamp="2025-01-01T10:00:00+00:00"),
+            RunRecord(run_id="r-2", repo_id="org/b", timestamp=None),
+        ]
+        result = runs_by_repo_summary(_hub_with_runs(runs))
+        assert result == {
+            "org/a": {"count": 2, "latest": "2025-01-01T10:00:00+00:00"},
+            "org/b": {"count": 1, "latest": ""},
+        }
+
     def test_untagged_bucket(self):
         runs = [_make_run(""), _make_run("")]
         hub = _hub_with_runs(runs)
@@ -1,13 +1,9 @@
 """Tests for schema.py v2.1 field extensions — backward compatibility + validation."""
 
 import json
-import sys
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-
 from lib.schema import RunRecord, validate_run_record, current_timestamp, generate_run_id
 
 
@@ -103,6 +99,12 @@ class TestNewFieldsPopulated:
         assert ("ingest", 30) in record.step_timings
         assert ("build", 120) in record.step_timings
 
+    def test_low_cardinality_fields_interned(self):
+        base = {"run_id": "r", "timestamp": "2026-02-10T12:00:00+00:00"}
+        a = RunRecord.from_dict({**base, "model_name": "".join(["claude-", "sonnet-4"])})
+        b = RunRecord.from_dict({**base, "model_name": "".join(["claude-", "sonnet-4"])})
+        assert a.model_name is b.model_name
+
     def test_step_timings_list_format(self):
         """step_timings as list of [step, seconds] pairs."""
         data = {
@@ -200,3 +202,11 @@ class TestValidationNewFields:
         )
         issues = validate_run_record(record)
         assert not any("recursive_parent_id" in i for i in issues)
+
+    def test_field_rules_pass_at_defaults(self):
+        """Rules are skipped for fields at their default, so defaults must be valid."""
+        from lib.schema import _FIELD_RULES
+
+        record = RunRecord(run_id="test-rule-defaults", timestamp=current_timestamp())
+        for name, check in _FIELD_RULES:
+            assert check(record) == (), name
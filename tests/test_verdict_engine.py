@@ -1,15 +1,46 @@
 """Tests for lib/verdict_engine.py — deterministic verdict generation."""
 
 import json
+import shutil
 import pytest
-from pathlib import Path
-
-import sys
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from lib.verdict_engine import VerdictEngine, CHECK_REGISTRY, RETRY_ELIGIBLE_CHECKS
 
 
+# All-pass sidecar, built once. _make_sidecar() copies the top level and
+# "quality", and rebuilds only the sections its arguments change.
+_BASE_QUALITY = {
+    "code_review": {"status": "PASS", "critical_count": 0, "minor_count": 0},
+    "validation": {
+        "success": True,
+        "pytest_passed": 10,
+        "pytest_failed": 0,
+        "ruff_passed": True,
+        "ruff_issues": 0,
+    },
+    "cursor_audit": {"p0_count": 0, "p1_count": 0, "p2_count": 0},
+    "pre_commit_safety": {"status": "PASS", "issues_count": 0},
+}
+
+_BASE_SIDECAR = {
+    "schema_version": "run.v1",
+    "artifact_id": "test-001",
+    "quality": _BASE_QUALITY,
+    "error_taxonomy": {"status": "complete", "fail_category": "", "fail_stage": ""},
+    "execution_context": {
+        "dry_run": False,
+        "auto": False,
+        "non_interactive": False,
+        "stop_at": None,
+        "target": "pse",
+        "steps_completed": ["ingest", "audit", "build", "code_review", "validate", "commit"],
+    },
+    "failed_test_names": [],
+    "step_timings": {},
+    "input_content_hash": "abc123",
+}
+
+
 def _make_sidecar(
     *,
     build_success=True,
@@ -23,114 +54,122 @@ def _make_sidecar(
     steps_completed=None,
     status="complete",
 ):
-    """Build a minimal sidecar dict for testing."""
-    return {
-        "schema_version": "run.v1",
-        "artifact_id": "test-001",
-        "quality": {
-            "code_review": {
-                "status": "PASS" if code_review_critical == 0 else "FAIL",
-                "critical_count": code_review_critical,
-                "minor_count": 0,
-            },
-            "validation": {
-                "success": tests_passing,
-                "pytest_passed": 10 if tests_passing else 5,
-                "pytest_failed": pytest_failed,
-                "ruff_passed": lint_issues == 0,
-                "ruff_issues": lint_issues,
-            },
-            "cursor_audit": {
-                "p0_count": arch_p0,
-                "p1_count": 0,
-                "p2_count": 0,
-            },
-            "pre_commit_safety": {
-                "status": pre_commit_status,
-                "issues_count": 0 if pre_commit_status == "PASS" else 1,
-            },
-        },
-        "error_taxonomy": {
+    """Build a minimal sidecar dict for testing.
+
+    Sections of the result may be replaced, but the dicts inside them can be
+    shared with the template and must not be mutated.
+    """
+    quality = dict(_BASE_QUALITY)
+    if code_review_critical:
+        quality["code_review"] = {
+            "status": "FAIL",
+            "critical_count": code_review_critical,
+            "minor_count": 0,
+        }
+    if not tests_passing or pytest_failed or lint_issues:
+        quality["validation"] = {
+            "success": tests_passing,
+            "pytest_passed": 10 if tests_passing else 5,
+            "pytest_failed": pytest_failed,
+            "ruff_passed": lint_issues == 0,
+            "ruff_issues": lint_issues,
+        }
+    if arch_p0:
+        quality["cursor_audit"] = {**_BASE_QUALITY["cursor_audit"], "p0_count": arch_p0}
+    if pre_commit_status != "PASS":
+        quality["pre_commit_safety"] = {"status": pre_commit_status, "issues_count": 1}
+
+    sidecar = dict(_BASE_SIDECAR, quality=quality)
+    if not build_success or status != "complete":
+        sidecar["error_taxonomy"] = {
             "status": status,
             "fail_category": "build" if not build_success else "",
             "fail_stage": "build" if not build_success else "",
-        },
-        "execution_context": {
-            "dry_run": False,
-            "auto": False,
-            "non_interactive": False,
-            "stop_at": None,
-            "target": "pse",
-            "steps_completed": steps_completed or ["ingest", "audit", "build", "code_review", "validate", "commit"],
-        },
-        "failed_test_names": failed_test_names or [],
-        "step_timings": {},
-        "input_content_hash": "abc123",
-    }
-
-
-@pytest.fixture
-def engine(tmp_path):
-    return VerdictEngine(str(tmp_path / "hub"))
+        }
+    if steps_completed:
+        sidecar["execution_context"] = {
+            **_BASE_SIDECAR["execution_context"],
+            "steps_completed": steps_completed,
+        }
+    if failed_test_names:
+        sidecar["failed_test_names"] = failed_test_names
+    return sidecar
+
+
+def _by_id(items, key="check_id"):
+    """Index verdict check results or fix hints by check ID."""
+    return {item[key]: item for item in items}
+
+
+@pytest.fixture(scope="module")
+def engine(tmp_path_factory):
+    """One engine for the module: it holds no per-verdict state."""
+    return VerdictEngine(str(tmp_path_factory.mktemp("hub")))
+
+
+@pytest.fixture(scope="module")
+def pass_verdict(engine):
+    """The all-pass verdict, generated once; tests must not mutate it."""
+    return engine.generate_verdict("test-001", _make_sidecar())
 
 
 class TestAllChecksPass:
-    def test_verdict_is_pass(self, engine):
-        sidecar = _make_sidecar()
-        verdict = engine.generate_verdict("test-001", sidecar)
+    def test_verdict_is_pass(self, pass_verdict):
+        verdict = pass_verdict
         assert verdict["verdict"] == "pass"
         assert verdict["degraded"] is False
         assert verdict["retry_eligible"] is False
         assert verdict["blocking_failures"] == []
         assert verdict["advisory_failures"] == []
 
-    def test_all_checks_passed(self, engine):
-        sidecar = _make_sidecar()
-        verdict = engine.generate_verdict("test-001", sidecar)
-        for check in verdict["check_results"]:
-            assert check["passed"] is True, f"{check['check_id']} should pass"
+    def test_all_checks_passed(self, pass_verdict):
+        failed = {c["check_id"] for c in pass_verdict["check_results"] if c["passed"] is not True}
+        assert not failed, f"checks should pass: {sorted(failed)}"
+
+
+# (id, _make_sidecar kwargs, blocking check, retry_eligible, fix hint action)
+_FAILURE_CASES = [
+    ("build", dict(build_success=False, status="build_failed"),
+     "build_success", True, "fix_build_error"),
+    ("tests", dict(tests_passing=False, pytest_failed=3,
+                   failed_test_names=["tests/test_a.py::test_one", "tests/test_b.py::test_two"]),
+     "tests_passing", True, "fix_failing_tests"),
+    ("arch_p0", dict(arch_p0=2),
+     "arch_p0_clear", True, "fix_architecture_violation"),
+    # code_review_clear and secrets_clean are NOT in RETRY_ELIGIBLE_CHECKS
+    ("code_review", dict(code_review_critical=1),
+     "code_review_clear", False, None),
+    ("secrets", dict(pre_commit_status="FAIL"),
+     "secrets_clean", False, None),
+]
+
+
+@pytest.fixture(scope="module")
+def failure_verdicts(engine):
+    """Case id -> verdict, for every _FAILURE_CASES entry in one batch."""
+    verdicts = engine.generate_verdicts(
+        ("test-001", _make_sidecar(**kwargs)) for _, kwargs, *_ in _FAILURE_CASES
+    )
+    return {case[0]: verdict for case, verdict in zip(_FAILURE_CASES, verdicts)}
 
 
 class TestBlockingFailures:
-    def test_build_failure(self, engine):
-        sidecar = _make_sidecar(build_success=False, status="build_failed")
-        verdict = engine.generate_verdict("test-001", sidecar)
-        assert verdict["verdict"] == "fail"
-        assert "build_success" in verdict["blocking_failures"]
-        assert verdict["retry_eligible"] is True
-
-    def test_test_failure(self, engine):
-        sidecar = _make_sidecar(
-            tests_passing=False,
-            pytest_failed=3,
-            failed_test_names=["tests/test_a.py::test_one", "tests/test_b.py::test_two"],
-        )
-        verdict = engine.generate_verdict("test-001", sidecar)
-        assert verdict["verdict"] == "fail"
-        assert "tests_passing" in verdict["blocking_failures"]
-        assert verdict["retry_eligible"] is True
+    @pytest.mark.parametrize("case", _FAILURE_CASES, ids=lambda c: c[0])
+    def test_failure_mode(self, failure_verdicts, case):
+        """One verdict per failure mode: outcome, retry eligibility and hints."""
+        case_id, kwargs, check_id, retry_eligible, hint_action = case
+        verdict = failure_verdicts[case_id]
 
-    def test_arch_p0_failure(self, engine):
-        sidecar = _make_sidecar(arch_p0=2)
-        verdict = engine.generate_verdict("test-001", sidecar)
-        assert verdict["verdict"] == "fail"
-        assert "arch_p0_clear" in verdict["blocking_failures"]
-        assert verdict["retry_eligible"] is True
-
-    def test_code_review_critical(self, engine):
-        sidecar = _make_sidecar(code_review_critical=1)
-        verdict = engine.generate_verdict("test-001", sidecar)
         assert verdict["verdict"] == "fail"
-        assert "code_review_clear" in verdict["blocking_failures"]
-        # code_review_clear is NOT in RETRY_ELIGIBLE_CHECKS
-        assert verdict["retry_eligible"] is False
+        assert check_id in verdict["blocking_failures"]
+        assert verdict["retry_eligible"] is retry_eligible
 
-    def test_secrets_failure(self, engine):
-        sidecar = _make_sidecar(pre_commit_status="FAIL")
-        verdict = engine.generate_verdict("test-001", sidecar)
-        assert verdict["verdict"] == "fail"
-        assert "secrets_clean" in verdict["blocking_failures"]
-        assert verdict["retry_eligible"] is False
+        if hint_action is None:
+            assert verdict["fix_hints"] == []
+        else:
+            hint = _by_id(verdict["fix_hints"])[check_id]
+            assert hint["action"] == hint_action
+            assert hint["suggested_scope"] == kwargs.get("failed_test_names", [])
 
 
 class TestAdvisoryFailures:
@@ -143,28 +182,6 @@ class TestAdvisoryFailures:
         assert verdict["retry_eligible"] is False
 
 
-class TestRetryEligibility:
-    def test_build_is_retryable(self, engine):
-        sidecar = _make_sidecar(build_success=False, status="build_failed")
-        verdict = engine.generate_verdict("test-001", sidecar)
-        assert verdict["retry_eligible"] is True
-
-    def test_tests_are_retryable(self, engine):
-        sidecar = _make_sidecar(tests_passing=False, pytest_failed=1)
-        verdict = engine.generate_verdict("test-001", sidecar)
-        assert verdict["retry_eligible"] is True
-
-    def test_secrets_not_retryable(self, engine):
-        sidecar = _make_sidecar(pre_commit_status="FAIL")
-        verdict = engine.generate_verdict("test-001", sidecar)
-        assert verdict["retry_eligible"] is False
-
-    def test_code_review_not_retryable(self, engine):
-        sidecar = _make_sidecar(code_review_critical=2)
-        verdict = engine.generate_verdict("test-001", sidecar)
-        assert verdict["retry_eligible"] is False
-
-
 class TestFailureSignature:
     def test_deterministic(self, engine):
         sidecar = _make_sidecar(tests_passing=False, pytest_failed=2)
@@ -172,18 +189,18 @@ class TestFailureSignature:
         v2 = engine.generate_verdict("test-001", sidecar)
         assert v1["failure_signature"] == v2["failure_signature"]
         assert len(v1["failure_signature"]) == 16
+        assert v1["failure_signature"] == engine._signature_for(v1["blocking_failures"])
 
     def test_different_failures_different_sig(self, engine):
-        s1 = _make_sidecar(build_success=False, status="build_failed")
-        s2 = _make_sidecar(tests_passing=False, pytest_failed=1)
-        v1 = engine.generate_verdict("test-001", s1)
-        v2 = engine.generate_verdict("test-002", s2)
-        assert v1["failure_signature"] != v2["failure_signature"]
+        assert engine._signature_for({"build_success"}) != engine._signature_for({"tests_passing"})
 
-    def test_pass_has_empty_signature(self, engine):
-        sidecar = _make_sidecar()
-        verdict = engine.generate_verdict("test-001", sidecar)
-        assert verdict["failure_signature"] == ""
+    def test_signature_ignores_order(self, engine):
+        assert engine._signature_for(["tests_passing", "build_success"]) == (
+            engine._signature_for(["build_success", "tests_passing"])
+        )
+
+    def test_pass_has_empty_signature(self, pass_verdict):
+        assert pass_verdict["failure_signature"] == ""
 
 
 class TestDegradedMode:
@@ -215,57 +232,66 @@ class TestDegradedMode:
 
 
 class TestFixHints:
-    def test_test_failure_hints(self, engine):
-        sidecar = _make_sidecar(
-            tests_passing=False,
-            pytest_failed=2,
-            failed_test_names=["tests/test_foo.py::test_bar"],
-        )
-        verdict = engine.generate_verdict("test-001", sidecar)
-        hints = verdict["fix_hints"]
-        assert len(hints) >= 1
-        test_hint = next(h for h in hints if h["check_id"] == "tests_passing")
-        assert test_hint["action"] == "fix_failing_tests"
-        assert "tests/test_foo.py::test_bar" in test_hint["suggested_scope"]
-
-    def test_build_failure_hints(self, engine):
-        sidecar = _make_sidecar(build_success=False, status="build_failed")
-        verdict = engine.generate_verdict("test-001", sidecar)
-        hints = verdict["fix_hints"]
-        build_hint = next(h for h in hints if h["check_id"] == "build_success")
-        assert build_hint["action"] == "fix_build_error"
+    def test_no_hints_on_pass(self, pass_verdict):
+        assert pass_verdict["fix_hints"] == []
 
-    def test_no_hints_on_pass(self, engine):
-        sidecar = _make_sidecar()
-        verdict = engine.generate_verdict("test-001", sidecar)
-        assert verdict["fix_hints"] == []
 
-    def test_no_hints_when_not_retryable(self, engine):
-        sidecar = _make_sidecar(pre_commit_status="FAIL")
-        verdict = engine.generate_verdict("test-001", sidecar)
-        assert verdict["fix_hints"] == []
+class TestGenerateVerdicts:
+    def test_matches_single_generation(self, engine):
+        items = [
+            ("test-001", _make_sidecar()),
+            ("test-002", _make_sidecar(lint_issues=2)),
+            ("test-003", None),
+        ]
+        batch = engine.generate_verdicts(items)
 
+        assert [v["artifact_id"] for v in batch] == ["test-001", "test-002", "test-003"]
+        assert len({v["generated_at"] for v in batch}) == 1
+        for verdict, (artifact_id, sidecar) in zip(batch, items):
+            single = engine.generate_verdict(artifact_id, sidecar)
+            assert {**verdict, "generated_at": None} == {**single, "generated_at": None}
 
-class TestWriteVerdict:
-    def test_write_and_read(self, engine, tmp_path):
-        sidecar = _make_sidecar()
-        verdict = engine.generate_verdict("test-001", sidecar)
-        path = engine.write_verdict("test-001", verdict)
+    def test_empty_batch(self, engine):
+        assert engine.generate_verdicts([]) == []
 
+
+@pytest.fixture(scope="class")
+def written(engine, pass_verdict):
+    """(verdict, path): the all-pass verdict, written once per test class."""
+    return pass_verdict, engine.write_verdict("test-001", pass_verdict)
+
+
+class TestWriteVerdict:
+    def test_written_path(self, written):
+        _, path = written
         assert path.exists()
         assert path.name == "test-001.verdict.v1.json"
 
-        data = json.loads(path.read_text())
+    def test_round_trip(self, written):
+        verdict, path = written
+        data = json.loads(path.read_bytes())
+        assert data == verdict
         assert data["verdict"] == "pass"
         assert data["artifact_id"] == "test-001"
 
 
+class TestVerdictsDir:
+    def test_recreated_after_removal(self, tmp_path):
+        e1 = VerdictEngine(str(tmp_path / "hub"))
+        assert e1.verdicts_dir.is_dir()
+        shutil.rmtree(e1.verdicts_dir)
+
+        e2 = VerdictEngine(str(tmp_path / "hub"))
+        assert e2.verdicts_dir.is_dir()
+        assert e2.write_verdict("test-001", {"verdict": "pass"}).exists()
+
+
 class TestStepNotRun:
     def test_missing_build_step_passes(self, engine):
         """If build step was never run (dry-run), build_success check passes."""
         sidecar = _make_sidecar(steps_completed=["ingest", "audit"])
         verdict = engine.generate_verdict("test-001", sidecar)
-        check = next(c for c in verdict["check_results"] if c["check_id"] == "build_success")
+        check = _by_id(verdict["check_results"])["build_success"]
         assert check["passed"] is True
 
     def test_missing_validation_passes(self, engine):
@@ -273,5 +299,5 @@ class TestStepNotRun:
         sidecar = _make_sidecar()
         sidecar["quality"]["validation"] = None
         verdict = engine.generate_verdict("test-001", sidecar)
-        check = next(c for c in verdict["check_results"] if c["check_id"] == "tests_passing")
+        check = _by_id(verdict["check_results"])["tests_passing"]
         assert check["passed"] is True